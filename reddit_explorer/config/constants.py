@@ -13,6 +13,9 @@ DATABASE_PATH = os.path.join(BASE_DIR, "reddit_explorer.db")
 # Reddit API
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36"
 REDDIT_HEADERS = {"User-Agent": USER_AGENT}
+FETCH_CONTENT_ON_SAVE = True  # Download post content and comments when saving a post
+SUMMARIZE_ON_SAVE = False  # Also summarize a saved post in the background once its content is downloaded; generating summaries then skips it, regenerating still redoes it
+MAX_DOWNLOAD_WORKERS = 8  # Parallel downloads when downloading a category's posts
 
 # UI Constants
 MAX_POSTS = 400
@@ -20,6 +23,7 @@ TREE_MIN_WIDTH = 150
 TREE_MAX_WIDTH = 250
 NAV_BUTTON_HEIGHT = 24
 IMAGE_MAX_WIDTH = 800
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024  # Memory for scaled post images kept in QPixmapCache
 
 # Database
 DEFAULT_CATEGORY = "Uncategorized"
@@ -29,3 +33,4 @@ VALID_IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif"]
 
 # OpenAI
 DEFAULT_OPENAI_MODEL = "gpt-4o"  # Default model if not specified in environment
+MAX_SUMMARY_WORKERS = 8  # Parallel requests when generating summaries
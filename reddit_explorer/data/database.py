@@ -3,10 +3,16 @@ Database connection and schema management for Reddit Explorer.
 """
 
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
 from reddit_explorer.config.constants import DATABASE_PATH, DEFAULT_CATEGORY
 
 
+def _py_lower(text: Optional[str]) -> Optional[str]:
+    """Lowercase text like Python does, for SQL's py_lower()."""
+    return text.lower() if isinstance(text, str) else text
+
+
 class Database:
     _instance: Optional["Database"] = None
 
@@ -18,7 +24,9 @@ class Database:
 
     def _initialize(self) -> None:
         """Initialize database connection and create tables if they don't exist."""
-        self.conn = sqlite3.connect(DATABASE_PATH)
+        self.conn = self.create_connection()
+        # Nesting depth of batch() blocks; commit() is deferred while inside one
+        self._batch_depth = 0
         self._create_schema()
 
     def _create_schema(self) -> None:
@@ -67,22 +75,157 @@ class Database:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (post_id) REFERENCES saved_posts(reddit_id)
             );
+
+            -- Category views filter on category/visibility ordered by date
+            CREATE INDEX IF NOT EXISTS idx_saved_posts_cat_show_date
+                ON saved_posts(category, show_in_categories, added_date DESC);
+
+            -- Summaries select the posts added within a time period, and
+            -- searches read posts newest first, filtering on visibility
+            -- without visiting hidden rows
+            CREATE INDEX IF NOT EXISTS idx_saved_posts_date_show
+                ON saved_posts(added_date DESC, show_in_categories);
+
+            -- Subreddit views look up saved posts by subreddit
+            CREATE INDEX IF NOT EXISTS idx_saved_posts_subreddit
+                ON saved_posts(subreddit_id);
+
+            -- Case-insensitive subreddit lookups match on LOWER(name)
+            CREATE INDEX IF NOT EXISTS idx_subreddits_lower_name
+                ON subreddits(LOWER(name));
         """
         )
 
+        self.full_text_search = self._create_search_index(cursor)
+
         # Ensure default category exists
         cursor.execute(
             "INSERT OR IGNORE INTO categories (name) VALUES (?)", (DEFAULT_CATEGORY,)
         )
         self.conn.commit()
 
+    def _create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the full-text index over post titles, contents and summaries.
+
+        The index uses the trigram tokenizer, so it matches substrings
+        case-insensitively like the LIKE queries it replaces. Triggers keep it
+        in step with saved_posts; an index created for an existing database is
+        filled from the posts already saved.
+
+        Args:
+            cursor: Cursor to create the index with
+
+        Returns:
+            True if the index is available, False if this SQLite build lacks
+            FTS5 or its trigram tokenizer
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'saved_posts_fts'"
+        )
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS saved_posts_fts USING fts5(
+                    title, content, summary,
+                    content='saved_posts', content_rowid='id', tokenize='trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS saved_posts_fts_insert
+                AFTER INSERT ON saved_posts BEGIN
+                    INSERT INTO saved_posts_fts(rowid, title, content, summary)
+                    VALUES (new.id, new.title, new.content, new.summary);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS saved_posts_fts_delete
+                AFTER DELETE ON saved_posts BEGIN
+                    INSERT INTO saved_posts_fts(saved_posts_fts, rowid, title, content, summary)
+                    VALUES ('delete', old.id, old.title, old.content, old.summary);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS saved_posts_fts_update
+                AFTER UPDATE OF title, content, summary ON saved_posts BEGIN
+                    INSERT INTO saved_posts_fts(saved_posts_fts, rowid, title, content, summary)
+                    VALUES ('delete', old.id, old.title, old.content, old.summary);
+                    INSERT INTO saved_posts_fts(rowid, title, content, summary)
+                    VALUES (new.id, new.title, new.content, new.summary);
+                END;
+            """
+            )
+        except sqlite3.OperationalError:
+            return False
+        if not exists:
+            cursor.execute(
+                "INSERT INTO saved_posts_fts(saved_posts_fts) VALUES ('rebuild')"
+            )
+        return True
+
+    def create_connection(self) -> sqlite3.Connection:
+        """Open a separate connection, e.g. for use from a worker thread."""
+        conn = sqlite3.connect(DATABASE_PATH)
+        # WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        # avoids an fsync on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Read pages through a memory map (up to 256 MB) instead of copying
+        # them into the page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        # SQLite's lower() only folds ASCII letters
+        conn.create_function("py_lower", 1, _py_lower, deterministic=True)
+        return conn
+
     def get_cursor(self) -> sqlite3.Cursor:
         """Get a database cursor."""
         return self.conn.cursor()
 
     def commit(self) -> None:
-        """Commit current transaction."""
-        self.conn.commit()
+        """Commit current transaction, unless inside a batch."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Run several writes in a single transaction.
+
+        Calls to commit() inside the block are deferred to its end. The whole
+        block is rolled back if it raises. Blocks may be nested; only the
+        outermost one commits.
+        """
+        if self._batch_depth == 0:
+            if self.conn.in_transaction:
+                self.conn.commit()
+            self.conn.execute("BEGIN IMMEDIATE")
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    def data_version(self) -> Tuple[int, int]:
+        """
+        Get a value that changes whenever the saved data changes.
+
+        Combines the number of rows changed through this connection with
+        SQLite's data_version, which advances when another connection, e.g. a
+        worker thread's, commits.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.conn.total_changes, data_version
+
+    def optimize(self) -> None:
+        """Refresh the query planner statistics that have gone stale."""
+        # Bound the work per index so this stays cheap on large tables
+        self.conn.execute("PRAGMA analysis_limit=400")
+        self.conn.execute("PRAGMA optimize")
 
     def close(self) -> None:
         """Close database connection."""
@@ -66,7 +66,7 @@ class SavedPost:
             category=row["category"],
             is_read=bool(row["is_read"]),
             show_in_categories=bool(row["show_in_categories"]),
-            added_date=datetime.strptime(row["added_date"], "%Y-%m-%d %H:%M:%S"),
+            added_date=datetime.fromisoformat(row["added_date"]),
         )
 
 
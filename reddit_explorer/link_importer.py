@@ -137,7 +137,7 @@ class LinkImporter:
             time_match = re.search(r"on (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", content)
             if not time_match:
                 return None
-            timestamp = datetime.strptime(time_match.group(1), "%Y-%m-%d %H:%M:%S")
+            timestamp = datetime.fromisoformat(time_match.group(1))
 
             # Count comments (## Comments followed by user comments)
             comments_count = len(re.findall(r"\*\*u/.*?\*\* on \d{4}", content))
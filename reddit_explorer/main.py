@@ -3,13 +3,16 @@ Main entry point for the Reddit Explorer application.
 """
 
 import sys
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
+from reddit_explorer.config.constants import PIXMAP_CACHE_LIMIT_KB
 from reddit_explorer.ui.main_window import RedditExplorer
 
 
 def main():
     """Main entry point."""
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     window = RedditExplorer()
 
     window.show()
@@ -5,7 +5,7 @@ Service for handling image downloads and caching.
 import os
 import hashlib
 import requests
-from typing import Optional
+from typing import Dict, Optional
 from reddit_explorer.config.constants import (
     CACHE_DIR,
     REDDIT_HEADERS,
@@ -21,6 +21,8 @@ class ImageService:
         """Initialize the image service."""
         os.makedirs(CACHE_DIR, exist_ok=True)
         self.db = Database()
+        # Image path per post ID, so repeated lookups skip the database
+        self._cached_paths: Dict[str, str] = {}
 
     def get_cached_image(self, post_id: str) -> Optional[str]:
         """
@@ -57,8 +59,12 @@ class ImageService:
             return None
 
         # Check if already cached
+        cached_path = self._cached_paths.get(post_id)
+        if cached_path:
+            return cached_path
         cached_path = self.get_cached_image(post_id)
         if cached_path:
+            self._cached_paths[post_id] = cached_path
             return cached_path
 
         try:
@@ -83,6 +89,7 @@ class ImageService:
             )
             self.db.commit()
 
+            self._cached_paths[post_id] = filepath
             return filepath
 
         except Exception as e:
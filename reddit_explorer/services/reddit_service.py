@@ -2,12 +2,27 @@
 Service for interacting with the Reddit API.
 """
 
+import threading
 import requests
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 from reddit_explorer.config.constants import REDDIT_HEADERS, MAX_POSTS
 from reddit_explorer.data.models import RedditPost
 
+# Sessions are not thread-safe, so each worker thread gets its own; paginated
+# and repeated requests from a thread reuse the same connection
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Get the calling thread's session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(REDDIT_HEADERS)
+        _thread_local.session = session
+    return session
+
 
 class RedditService:
     """Service for fetching data from Reddit."""
@@ -31,7 +46,7 @@ class RedditService:
             url += f"&after={after}"
 
         try:
-            response = requests.get(url, headers=REDDIT_HEADERS)
+            response = _get_session().get(url)
             response.raise_for_status()
             data = response.json()
 
@@ -46,35 +61,52 @@ class RedditService:
             return []
 
     @staticmethod
-    def fetch_all_subreddit_posts(
+    def iter_subreddit_posts(
         subreddit_name: str, max_posts: int = MAX_POSTS
-    ) -> List[RedditPost]:
+    ) -> Iterator[RedditPost]:
         """
-        Fetch all posts from a subreddit up to max_posts.
+        Lazily yield posts from a subreddit up to max_posts.
+
+        Pages are only requested as the caller consumes posts, so stopping
+        iteration early also stops further pagination requests.
 
         Args:
             subreddit_name: Name of the subreddit
-            max_posts: Maximum number of posts to fetch
+            max_posts: Maximum number of posts to yield
 
-        Returns:
-            List of RedditPost objects
+        Yields:
+            RedditPost objects, newest first
         """
-        all_posts: List[RedditPost] = []
+        yielded = 0
         after = None
 
-        while len(all_posts) < max_posts:
+        while yielded < max_posts:
             posts = RedditService.fetch_subreddit_posts(subreddit_name, after)
             if not posts:
-                break
+                return
 
-            all_posts.extend(posts)
+            for post in posts[: max_posts - yielded]:
+                yield post
+            yielded += len(posts)
 
             # Get the last post's fullname for pagination
-            after = f"t3_{posts[-1].id}" if posts else None
-            if not after:
-                break
+            after = f"t3_{posts[-1].id}"
+
+    @staticmethod
+    def fetch_all_subreddit_posts(
+        subreddit_name: str, max_posts: int = MAX_POSTS
+    ) -> List[RedditPost]:
+        """
+        Fetch all posts from a subreddit up to max_posts.
+
+        Args:
+            subreddit_name: Name of the subreddit
+            max_posts: Maximum number of posts to fetch
 
-        return all_posts[:max_posts]
+        Returns:
+            List of RedditPost objects
+        """
+        return list(RedditService.iter_subreddit_posts(subreddit_name, max_posts))
 
     @staticmethod
     def fetch_post_details(subreddit: str, post_id: str) -> str:
@@ -91,7 +123,7 @@ class RedditService:
         url = f"https://www.reddit.com/r/{subreddit}/comments/{post_id}/.json?limit=100"
 
         try:
-            response = requests.get(url, headers=REDDIT_HEADERS)
+            response = _get_session().get(url)
             response.raise_for_status()
             data = response.json()
 
@@ -0,0 +1,336 @@
+"""
+Item model backing the explorer tree.
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
+
+# Root sections of the explorer, in display order
+SUBREDDITS = 0
+CATEGORIES = 1
+SUMMARIZE = 2
+SEARCH = 3
+
+_SECTION_TITLES = ["Subreddits", "Categories", "Summarize", "Search"]
+
+# Category counting the posts shown in categories, up to a limit
+MOST_POPULAR = "Most popular"
+MOST_POPULAR_LIMIT = 200
+
+# Item data roles holding an entry's plain name and a category's post count
+NAME_ROLE = Qt.ItemDataRole.UserRole
+COUNT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class ExplorerModel(QAbstractItemModel):
+    """
+    Two-level model of the explorer: the root sections and their entries.
+
+    Root indexes have an internal id of 0, entries the row of their section
+    plus one. Subreddit and category entries are kept sorted case-insensitively;
+    categories additionally carry a post count shown as "name (count)", or as
+    "name (...)" until it has been set. The count of MOST_POPULAR follows the
+    running total of posts shown in categories.
+
+    A section's entries are only exposed to views once it is first expanded,
+    through canFetchMore/fetchMore; until then changes only touch the lists.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """Initialize an empty model with the root sections."""
+        super().__init__(parent)
+        self._names: List[List[str]] = [[] for _ in _SECTION_TITLES]
+        # Lowercased names per section, kept in step with _names for bisecting
+        self._keys: List[List[str]] = [[] for _ in _SECTION_TITLES]
+        self._counts: Dict[str, int] = {}
+        self._shown_total = 0
+        self._fetched: List[bool] = [False for _ in _SECTION_TITLES]
+
+    def populate(
+        self,
+        subreddits: List[str],
+        categories: List[str],
+        summarize_periods: List[str],
+    ) -> None:
+        """
+        Replace all entries in one reset.
+
+        Category post counts start out unknown; set them with set_count.
+
+        Args:
+            subreddits: Subreddit names
+            categories: Category names
+            summarize_periods: Time periods listed under Summarize
+        """
+        self.beginResetModel()
+        for section, names, is_sorted in (
+            (SUBREDDITS, subreddits, False),
+            (CATEGORIES, categories, False),
+            (SUMMARIZE, summarize_periods, True),
+            (SEARCH, [], True),
+        ):
+            if not is_sorted:
+                names = sorted(names, key=str.lower)
+            self._names[section] = names
+            self._keys[section] = [name.lower() for name in names]
+        self._counts = {}
+        self._shown_total = 0
+        self._fetched = [False for _ in _SECTION_TITLES]
+        self.endResetModel()
+
+    def section_index(self, section: int) -> QModelIndex:
+        """Get the index of a root section."""
+        return self.createIndex(section, 0, 0)
+
+    def item_at(self, index: QModelIndex) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Resolve an index to its section and entry name.
+
+        Args:
+            index: Index in this model
+
+        Returns:
+            Tuple of (section, name); name is None for root sections and both are
+            None for an invalid index
+        """
+        if not index.isValid():
+            return None, None
+        if index.internalId() == 0:
+            return index.row(), None
+        section = index.internalId() - 1
+        return section, self._names[section][index.row()]
+
+    def names(self, section: int) -> List[str]:
+        """Get the entry names of a section, in display order."""
+        return self._names[section]
+
+    def find_name(self, section: int, name: str) -> Optional[str]:
+        """
+        Look up an entry case-insensitively.
+
+        Args:
+            section: Section to search
+            name: Entry name in any casing
+
+        Returns:
+            The entry's name as stored, or None if there is no such entry
+        """
+        keys = self._keys[section]
+        key = name.lower()
+        row = bisect.bisect_left(keys, key)
+        if row < len(keys) and keys[row] == key:
+            return self._names[section][row]
+        return None
+
+    def add_item(self, section: int, name: str, count: int = 0) -> None:
+        """
+        Insert an entry at its alphabetical position.
+
+        Args:
+            section: Section to add the entry to
+            name: Entry name
+            count: Initial post count, for categories
+        """
+        key = name.lower()
+        row = bisect.bisect_right(self._keys[section], key)
+        fetched = self._fetched[section]
+        if fetched:
+            self.beginInsertRows(self.section_index(section), row, row)
+        self._names[section].insert(row, name)
+        self._keys[section].insert(row, key)
+        if section == CATEGORIES:
+            self._counts[name] = count
+        if fetched:
+            self.endInsertRows()
+
+    def remove_item(self, section: int, name: str) -> None:
+        """Remove an entry if it exists."""
+        row = self._find_row(section, name)
+        if row is None:
+            return
+        fetched = self._fetched[section]
+        if fetched:
+            self.beginRemoveRows(self.section_index(section), row, row)
+        del self._names[section][row]
+        del self._keys[section][row]
+        if fetched:
+            self.endRemoveRows()
+
+    def rename_item(self, section: int, old_name: str, new_name: str) -> None:
+        """Rename an entry, moving it to keep the section sorted."""
+        count = self._counts.pop(old_name, 0)
+        self.remove_item(section, old_name)
+        self.add_item(section, new_name, count)
+
+    def count(self, category_name: str) -> int:
+        """Get the post count of a category."""
+        return self._counts.get(category_name, 0)
+
+    def set_count(self, category_name: str, count: int) -> None:
+        """Set the post count of a category, repainting only on change."""
+        if self._counts.get(category_name) == count:
+            return
+        self._counts[category_name] = count
+        row = self._find_row(CATEGORIES, category_name)
+        if row is not None and self._fetched[CATEGORIES]:
+            index = self.createIndex(row, 0, CATEGORIES + 1)
+            self.dataChanged.emit(
+                index, index, [Qt.ItemDataRole.DisplayRole, COUNT_ROLE]
+            )
+
+    def set_counts(self, counts: Dict[str, int], shown_total: int) -> None:
+        """
+        Set the post counts of all categories at once.
+
+        Walks the categories in row order, so no per-name lookup is needed,
+        and repaints the changed rows with a single dataChanged.
+
+        Args:
+            counts: Post count per category name; missing categories get 0
+            shown_total: Number of posts shown in categories
+        """
+        self._shown_total = shown_total
+        counts = {**counts, MOST_POPULAR: min(MOST_POPULAR_LIMIT, shown_total)}
+        first_row = last_row = -1
+        for row, name in enumerate(self._names[CATEGORIES]):
+            count = counts.get(name, 0)
+            if self._counts.get(name) != count:
+                self._counts[name] = count
+                if first_row < 0:
+                    first_row = row
+                last_row = row
+        if first_row >= 0 and self._fetched[CATEGORIES]:
+            self.dataChanged.emit(
+                self.createIndex(first_row, 0, CATEGORIES + 1),
+                self.createIndex(last_row, 0, CATEGORIES + 1),
+                [Qt.ItemDataRole.DisplayRole, COUNT_ROLE],
+            )
+
+    def adjust_count(self, category_name: str, delta: int) -> None:
+        """Add delta to the post count of a category."""
+        self.set_count(category_name, self.count(category_name) + delta)
+
+    def adjust_shown_count(self, category_name: str, delta: int) -> None:
+        """
+        Add delta to a category's count for posts that were shown or hidden.
+
+        Unlike moving posts between categories, this also changes the total of
+        posts shown in categories, and with it the count of MOST_POPULAR.
+
+        Args:
+            category_name: Category of the posts
+            delta: Change in the number of shown posts
+        """
+        self.adjust_count(category_name, delta)
+        self._shown_total += delta
+        self.set_count(MOST_POPULAR, min(MOST_POPULAR_LIMIT, self._shown_total))
+
+    def _find_row(self, section: int, name: str) -> Optional[int]:
+        """Find the row of an entry by exact name."""
+        keys = self._keys[section]
+        key = name.lower()
+        row = bisect.bisect_left(keys, key)
+        while row < len(keys) and keys[row] == key:
+            if self._names[section][row] == name:
+                return row
+            row += 1
+        return None
+
+    def index(
+        self, row: int, column: int, parent: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+        """Create the index of a row under parent."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # type: ignore[override]
+        """Get the parent of an index."""
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.section_index(index.internalId() - 1)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of children of parent."""
+        if not parent.isValid():
+            return len(_SECTION_TITLES)
+        if parent.internalId() == 0 and self._fetched[parent.row()]:
+            return len(self._names[parent.row()])
+        return 0
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Check whether an index has children.
+
+        Sections that haven't been fetched yet are assumed to have entries, so
+        they can be expanded; Search never has any. Entries are leaves.
+        """
+        if not parent.isValid():
+            return True
+        if parent.internalId() != 0:
+            return False
+        section = parent.row()
+        if section == SEARCH:
+            return False
+        return not self._fetched[section] or bool(self._names[section])
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Check whether a section's entries have not been exposed yet."""
+        return (
+            parent.isValid()
+            and parent.internalId() == 0
+            and not self._fetched[parent.row()]
+        )
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Expose a section's entries to views."""
+        if not self.canFetchMore(parent):
+            return
+        section = parent.row()
+        count = len(self._names[section])
+        if count:
+            self.beginInsertRows(parent, 0, count - 1)
+        self._fetched[section] = True
+        if count:
+            self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """The explorer has a single column."""
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get the data stored under role for an index."""
+        section, name = self.item_at(index)
+        if section is None:
+            return None
+        if name is None:
+            if role in (Qt.ItemDataRole.DisplayRole, NAME_ROLE):
+                return _SECTION_TITLES[section]
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            if section == CATEGORIES:
+                count = self._counts.get(name)
+                return f"{name} ({'...' if count is None else count})"
+            return name
+        if role == NAME_ROLE:
+            return name
+        if role == COUNT_ROLE and section == CATEGORIES:
+            return self._counts.get(name, 0)
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get the header label."""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return "Explorer"
+        return None
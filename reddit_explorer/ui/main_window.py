@@ -2,17 +2,21 @@
 Main window for the Reddit Explorer application.
 """
 
-from typing import List, Optional, Dict, Any, cast, Callable
+from typing import List, Optional, Dict, Any, Set, Tuple, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import datetime, timedelta
+import json
+import re
 import sqlite3
 from PySide6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QCheckBox,
     QMenu,
     QSizePolicy,
@@ -20,7 +24,14 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressDialog,
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer, QModelIndex, QThreadPool
+from PySide6.QtGui import QCloseEvent
+from reddit_explorer.config.constants import (
+    FETCH_CONTENT_ON_SAVE,
+    MAX_DOWNLOAD_WORKERS,
+    MAX_SUMMARY_WORKERS,
+    SUMMARIZE_ON_SAVE,
+)
 from reddit_explorer.data.models import RedditPost
 from reddit_explorer.data.database import Database
 from reddit_explorer.services.reddit_service import RedditService
@@ -30,9 +41,43 @@ from reddit_explorer.ui.browser.browser_view import BrowserView
 from reddit_explorer.ui.widgets.subreddit_view import SubredditView
 from reddit_explorer.ui.widgets.summarize_view import SummarizeView
 from reddit_explorer.ui.widgets.search_view import SearchView
+from reddit_explorer.ui.worker import Worker, start_worker
+from reddit_explorer.ui.explorer_model import (
+    ExplorerModel,
+    SUBREDDITS,
+    CATEGORIES,
+    SUMMARIZE,
+    SEARCH,
+)
+
+# Column list and values of a newly saved post, prefixed with INSERT [OR IGNORE]
+_INSERT_SAVED_POST_SQL = """
+    INTO saved_posts (reddit_id, subreddit_id, title, url, category, show_in_categories, is_read, num_comments, added_date, content, content_date)
+    VALUES (?, ?, ?, ?, 'Uncategorized', 1, 1, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
 
-# Type alias for row factory function
-RowFactory = Callable[[sqlite3.Cursor, tuple[Any, ...]], Dict[str, Any]]
+# Extracts the post ID from a Reddit post URL
+_POST_ID_RE = re.compile(r"/comments/([^/]+)/")
+
+# Stores downloaded content, taking (content, reddit_id)
+_UPDATE_POST_CONTENT_SQL = """
+    UPDATE saved_posts SET content = ?, content_date = CURRENT_TIMESTAMP
+    WHERE reddit_id = ?
+"""
+
+# How often a progress dialog is updated and checked for a cancel while
+# waiting for parallel work, in seconds
+_PROGRESS_UPDATE_INTERVAL = 0.1
+
+# How long the Next button stays disabled after a click, in milliseconds
+_NEXT_CLICK_DEBOUNCE_MS = 300
+
+# Flips a post's visibility, returning its category only if the flag changed
+_SET_SHOW_IN_CATEGORIES_SQL = """
+    UPDATE saved_posts SET show_in_categories = ?
+    WHERE reddit_id = ? AND show_in_categories != ?
+    RETURNING category
+"""
 
 
 class RedditExplorer(QMainWindow):
@@ -56,9 +101,24 @@ class RedditExplorer(QMainWindow):
         # Initialize state
         self._current_category_name: Optional[str] = None
         self.current_category_posts: List[RedditPost] = []
+        # Lazily built post ID -> position index into current_category_posts
+        self._category_post_positions: Optional[Dict[str, int]] = None
+        self._show_in_categories: Dict[str, bool] = {}
         self.current_post_index: int = -1
         self._current_view: str = "subreddit"
         self.current_category: Optional[str] = None
+        self._view_load_id: int = 0
+        self._refresh_pending: bool = False
+        self._closing: bool = False
+        # Description per category name, loaded on first use
+        self._category_descriptions: Optional[Dict[str, Optional[str]]] = None
+        # Category menu shared by all post widgets, and the names it lists
+        self._category_menu: Optional[QMenu] = None
+        self._category_menu_names: List[str] = []
+
+        # Counting category posts scans saved_posts; do it after the window
+        # has painted
+        self.refresh_category_counts()
 
         # Regenerate incomplete summaries on startup
         # self.regenerate_summaries()
@@ -78,9 +138,17 @@ class RedditExplorer(QMainWindow):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_panel.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
 
-        # Tree widget for subreddits and categories
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabel("Explorer")
+        # Tree view for subreddits and categories
+        self.explorer_model = ExplorerModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.explorer_model)
+
+        # All rows are single-line text, so skip per-row size hints, sorting
+        # and expand animations
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSortingEnabled(False)
+        self.tree.setAnimated(False)
+        self.tree.setExpandsOnDoubleClick(False)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
 
@@ -160,65 +228,69 @@ class RedditExplorer(QMainWindow):
         """Load subreddits and categories from database into tree widget."""
         cursor = self.db.get_cursor()
 
-        # Create main categories in tree
-        self.subreddits_root = QTreeWidgetItem(self.tree, ["Subreddits"])
-        self.categories_root = QTreeWidgetItem(self.tree, ["Categories"])
-        self.summarize_root = QTreeWidgetItem(self.tree, ["Summarize"])
-        self.search_root = QTreeWidgetItem(self.tree, ["Search"])
-
-        # Load subreddits under subreddits root
-        cursor.execute("SELECT name FROM subreddits ORDER BY name")
-        for row in cursor.fetchall():
-            QTreeWidgetItem(self.subreddits_root, [row[0]])
-
-        # Load categories and their post counts under categories root
+        # Load subreddit and category names in one query
         cursor.execute(
             """
-            SELECT c.name, COUNT(sp.id) as post_count 
-            FROM categories c 
-            LEFT JOIN saved_posts sp ON sp.category = c.name AND sp.show_in_categories = 1
-            GROUP BY c.name 
-            ORDER BY c.name
+            SELECT 'S' AS kind, name FROM subreddits
+            UNION ALL
+            SELECT 'C', name FROM categories
+            ORDER BY kind, name
         """
         )
-        for row in cursor.fetchall():
-            category_name = row[0]
-            post_count = row[1]
-            display_text = f"{category_name} ({post_count})"
-            QTreeWidgetItem(self.categories_root, [display_text])
+        subreddit_names: List[str] = []
+        category_names: List[str] = []
+        for kind, name in cursor.fetchall():
+            if kind == "S":
+                subreddit_names.append(name)
+            else:
+                category_names.append(name)
+
+        # Populate the model in a single reset
+        self.explorer_model.populate(
+            subreddit_names,
+            category_names,
+            ["Last 24 hours", "Last 3 days"],
+        )
+
+        # Expanding a root lets the model expose that section's entries
+        for section in (SUBREDDITS, CATEGORIES, SUMMARIZE, SEARCH):
+            self.tree.expand(self.explorer_model.section_index(section))
 
-        # Add summarize items
-        QTreeWidgetItem(self.summarize_root, ["Last 24 hours"])
-        QTreeWidgetItem(self.summarize_root, ["Last 3 days"])
+    def closeEvent(self, event: QCloseEvent):
+        """Drop queued background work and ignore results still in flight."""
+        self._closing = True
+        QThreadPool.globalInstance().clear()
 
-        self.tree.expandAll()
+        # Keep the planner's index statistics current for the next start
+        self.db.optimize()
+        super().closeEvent(event)
 
     def _setup_connections(self):
         """Setup signal/slot connections."""
         self.next_btn.clicked.connect(self._handle_next_click)
         self.done_btn.clicked.connect(self._handle_done_click)
-        self.tree.itemClicked.connect(self._handle_tree_click)
+        self.tree.clicked.connect(self._handle_tree_click)
         self.browser_category_checkbox.stateChanged.connect(
             self._handle_browser_category_changed
         )
 
     def _show_context_menu(self, position: QPoint):
         """Show context menu for tree items."""
-        item = cast(Optional[QTreeWidgetItem], self.tree.itemAt(position))
-        if item is None:
+        section, name = self.explorer_model.item_at(self.tree.indexAt(position))
+        if section is None:
             return
 
         menu = QMenu()
 
         # Handle right-click on root items
-        if item.text(0) == "Categories":
+        if section == CATEGORIES and name is None:
             add_action = menu.addAction("Add Category")
             action = menu.exec_(self.tree.viewport().mapToGlobal(position))
 
             if action == add_action:
                 self._add_category()
             return
-        elif item.text(0) == "Subreddits":
+        elif section == SUBREDDITS and name is None:
             add_action = menu.addAction("Add Subreddit")
             action = menu.exec_(self.tree.viewport().mapToGlobal(position))
 
@@ -227,9 +299,8 @@ class RedditExplorer(QMainWindow):
             return
 
         # Handle right-click on category items
-        parent = item.parent()
-        if parent and parent.text(0) == "Categories":
-            category_name = item.text(0).split(" (")[0]
+        if section == CATEGORIES and name is not None:
+            category_name = name
 
             # Initialize menu actions
             rename_action = None
@@ -256,16 +327,16 @@ class RedditExplorer(QMainWindow):
                 self._auto_categorize_posts(category_name)
             elif category_name != "Uncategorized":
                 if action == rename_action:
-                    self._rename_category(item, category_name)
+                    self._rename_category(category_name)
                 elif action == remove_action:
-                    self._remove_category(item, category_name)
+                    self._remove_category(category_name)
                 elif action == uncategorize_action:
-                    self._uncategorize_posts(item, category_name)
+                    self._uncategorize_posts(category_name)
             return
 
         # Handle right-click on subreddit items
-        if parent and parent.text(0) == "Subreddits":
-            subreddit_name = item.text(0)
+        if section == SUBREDDITS and name is not None:
+            subreddit_name = name
             show_400_action = menu.addAction("Show 600")
             menu.addSeparator()
             rename_action = menu.addAction("Rename")
@@ -276,7 +347,7 @@ class RedditExplorer(QMainWindow):
             if action == remove_action:
                 self._remove_subreddit(subreddit_name)
             elif action == rename_action:
-                self._rename_subreddit(item, subreddit_name)
+                self._rename_subreddit(subreddit_name)
             elif action == show_400_action:
                 self._load_subreddit_posts_fixed(subreddit_name, 600)
 
@@ -296,27 +367,10 @@ class RedditExplorer(QMainWindow):
                 # Add to database
                 cursor.execute("INSERT INTO categories (name) VALUES (?)", (name,))
                 self.db.commit()
+                self._category_descriptions = None
 
                 # Add to tree with initial count of 0
-                display_text = f"{name} (0)"
-
-                # Find the correct position to insert alphabetically
-                insert_pos = 0
-                for i in range(self.categories_root.childCount()):
-                    item = self.categories_root.child(i)
-                    current_name = item.text(0).split(" (")[0]
-                    if name.lower() < current_name.lower():
-                        break
-                    insert_pos = i + 1
-
-                # Insert at the correct position
-                QTreeWidgetItem(self.categories_root)  # Create empty item
-                self.categories_root.insertChild(
-                    insert_pos, QTreeWidgetItem([display_text])
-                )
-                self.categories_root.takeChild(
-                    self.categories_root.childCount() - 1
-                )  # Remove empty item
+                self.explorer_model.add_item(CATEGORIES, name)
 
             except sqlite3.IntegrityError:
                 # Category already exists
@@ -324,14 +378,8 @@ class RedditExplorer(QMainWindow):
 
     def _set_category_description(self, category_name: str):
         """Show dialog to set category description."""
-        cursor = self.db.get_cursor()
-
         # Get current description
-        cursor.execute(
-            "SELECT description FROM categories WHERE name = ?", (category_name,)
-        )
-        result = cursor.fetchone()
-        current_desc = result[0] if result and result[0] else ""
+        current_desc = self._get_category_descriptions().get(category_name) or ""
 
         # Show dialog with current description
         desc, ok = QInputDialog.getMultiLineText(
@@ -343,11 +391,29 @@ class RedditExplorer(QMainWindow):
 
         if ok:
             # Update description in database
+            cursor = self.db.get_cursor()
             cursor.execute(
                 "UPDATE categories SET description = ? WHERE name = ?",
                 (desc.strip() if desc else None, category_name),
             )
             self.db.commit()
+            self._category_descriptions = None
+
+    def _get_category_descriptions(self) -> Dict[str, Optional[str]]:
+        """
+        Get the description of every category.
+
+        The result is cached until a category is added, renamed, removed or
+        has its description changed.
+
+        Returns:
+            Dictionary mapping category names to descriptions
+        """
+        if self._category_descriptions is None:
+            cursor = self.db.get_cursor()
+            cursor.execute("SELECT name, description FROM categories")
+            self._category_descriptions = {row[0]: row[1] for row in cursor}
+        return self._category_descriptions
 
     def _remove_subreddit(self, subreddit_name: str):
         """Remove a subreddit from database and tree."""
@@ -357,42 +423,52 @@ class RedditExplorer(QMainWindow):
         self.db.commit()
 
         # Remove from tree
-        root = self.tree.findItems("Subreddits", Qt.MatchFlag.MatchExactly)[0]
-        for i in range(root.childCount()):
-            if root.child(i).text(0) == subreddit_name:
-                root.removeChild(root.child(i))
-                break
+        self.explorer_model.remove_item(SUBREDDITS, subreddit_name)
 
-    def _handle_tree_click(self, item: QTreeWidgetItem):
+    def _handle_tree_click(self, index: QModelIndex):
         """Handle single-click events on tree items."""
+        section, name = self.explorer_model.item_at(index)
+
         # Handle root items
-        if item.text(0) == "Search":
+        if section == SEARCH:
             self._load_search_view()
             return
 
-        parent = cast(Optional[QTreeWidgetItem], item.parent())
-        if parent is None:
+        if name is None:
             return
 
-        if parent.text(0) == "Subreddits":
-            subreddit_name = item.text(0)
-            self._load_subreddit_posts(subreddit_name)
-        elif parent.text(0) == "Categories":
-            # Extract category name without post count
-            category_name = item.text(0).split(" (")[0]
-            self.load_category_posts(category_name)
-        elif parent.text(0) == "Summarize":
-            time_period = item.text(0)
-            self._load_summarize_view(time_period)
+        if section == SUBREDDITS:
+            self._load_subreddit_posts(name)
+        elif section == CATEGORIES:
+            self.load_category_posts(name)
+        elif section == SUMMARIZE:
+            self._load_summarize_view(name)
+
+    def _show_views(self, *views: QWidget):
+        """
+        Show the given views and hide the other switchable ones.
+
+        Only widgets whose visibility actually changes are touched, so switching
+        between items of the same kind doesn't invalidate the layout.
+
+        Args:
+            *views: The views to show
+        """
+        for view in (
+            self.browser,
+            self.nav_buttons,
+            self.subreddit_view,
+            self.summarize_view,
+            self.search_view,
+        ):
+            visible = view in views
+            if view.isHidden() == visible:
+                view.setVisible(visible)
 
     def _load_subreddit_posts(self, subreddit_name: str):
         """Load and display posts from a subreddit."""
         # Clear and hide browser and navigation buttons, show subreddit view
-        self.browser.hide()
-        self.nav_buttons.hide()
-        self.summarize_view.hide()  # Hide summary view
-        self.search_view.hide()  # Hide search view
-        self.subreddit_view.show()
+        self._show_views(self.subreddit_view)
         self.subreddit_view.clear()
         self._current_view = "subreddit"  # Set current view to subreddit
 
@@ -411,16 +487,34 @@ class RedditExplorer(QMainWindow):
         )
         saved_posts = {row[0] for row in cursor.fetchall()}
 
-        # Fetch posts from Reddit
-        posts = self.reddit_service.fetch_all_subreddit_posts(subreddit_name)
+        # Fetch posts from Reddit on a worker thread
+        self._start_view_load(
+            lambda posts: self._show_subreddit_posts(posts, saved_posts),
+            self._fetch_new_subreddit_posts,
+            subreddit_name,
+            saved_posts,
+        )
+
+    def _fetch_new_subreddit_posts(
+        self, subreddit_name: str, saved_posts: Set[str]
+    ) -> List[RedditPost]:
+        """
+        Fetch the posts newer than the most recent saved post. Runs on a worker thread.
+
+        Args:
+            subreddit_name: Name of the subreddit
+            saved_posts: IDs of the saved posts of this subreddit
 
-        # First find the most recent saved post
+        Returns:
+            List of RedditPost objects, oldest first
+        """
+        # Fetch posts from Reddit lazily, up to and including the most recent
+        # saved post; breaking out of the loop stops any further pagination
         posts_to_show: List[RedditPost] = []
-        for post in posts:
-            is_saved = post.id in saved_posts
+        for post in self.reddit_service.iter_subreddit_posts(subreddit_name):
             posts_to_show.append(post)
 
-            if is_saved:  # Stop if we found a saved post
+            if post.id in saved_posts:  # Stop if we found a saved post
                 break
 
             if len(posts_to_show) >= 200:  # Also stop if we hit the limit
@@ -428,16 +522,19 @@ class RedditExplorer(QMainWindow):
 
         # Now reverse the posts we want to show
         posts_to_show.reverse()
-
-        # Add posts to view
-        total_posts = 0
-        for post in posts_to_show:
-            is_saved = post.id in saved_posts
-            self.subreddit_view.add_post(post, is_saved, view_type="subreddit")
-            total_posts += 1
+        return posts_to_show
+
+    def _show_subreddit_posts(
+        self, posts_to_show: List[RedditPost], saved_posts: Set[str]
+    ):
+        """Display fetched subreddit posts."""
+        # Add posts to view in batches
+        self.subreddit_view.add_posts(
+            [(post, post.id in saved_posts) for post in posts_to_show]
+        )
 
         # Update window title with post count
-        self.setWindowTitle(f"Reddit Explorer ({total_posts} posts)")
+        self.setWindowTitle(f"Reddit Explorer ({len(posts_to_show)} posts)")
 
         # Scroll to top
         self.subreddit_view.verticalScrollBar().setValue(0)
@@ -445,11 +542,7 @@ class RedditExplorer(QMainWindow):
     def load_category_posts(self, category_name: str):
         """Load and display posts from a specific category."""
         # Clear and hide browser and navigation buttons, show subreddit view
-        self.browser.hide()
-        self.nav_buttons.hide()
-        self.summarize_view.hide()
-        self.search_view.hide()
-        self.subreddit_view.show()
+        self._show_views(self.subreddit_view)
         self.subreddit_view.clear()
         self._current_view = "category"
 
@@ -457,64 +550,129 @@ class RedditExplorer(QMainWindow):
         self._current_category_name = category_name
         self.current_category = category_name
         self.current_category_posts = []
+        self._category_post_positions = None
+        self._show_in_categories = {}
         self.current_post_index = -1
 
-        cursor = self.db.get_cursor()
-
-        # Enable dictionary access to rows
-        def dict_factory(
-            cursor: sqlite3.Cursor, row: tuple[Any, ...]
-        ) -> Dict[str, Any]:
-            d = {}
-            for idx, col in enumerate(cursor.description):
-                d[col[0]] = row[idx]
-            return d
-
-        cursor.row_factory = cast(
-            Callable[[sqlite3.Cursor, sqlite3.Row], Any], dict_factory
+        # Query the posts on a worker thread and populate the view when ready
+        self._start_view_load(
+            self._show_category_posts, self._query_category_posts, category_name
         )
 
-        # Remove special handling for "Most popular" category
-        cursor.execute(
-            """
-            SELECT sp.*, s.name as subreddit_name
-            FROM saved_posts sp
-            JOIN subreddits s ON sp.subreddit_id = s.id
-            WHERE sp.category = ? AND sp.show_in_categories = 1
-            ORDER BY sp.added_date DESC
-            """,
-            (category_name,),
-        )
+    def _start_view_load(
+        self,
+        on_result: Callable[[Any], None],
+        fn: Callable[..., Any],
+        *args: Any,
+    ):
+        """
+        Run a view's loading work on a worker thread.
 
-        total_posts = 0
-        for row in cursor.fetchall():
-            # Create post data from database row
-            post = RedditPost(
-                id=row["reddit_id"],
-                title=row["title"],
-                url=row["url"],
-                subreddit=row["subreddit_name"],
-                created_utc=datetime.strptime(
-                    row["added_date"], "%Y-%m-%d %H:%M:%S"
-                ).timestamp(),
-                num_comments=row["num_comments"],
-                selftext="",
-            )
+        The result, or an error, is only passed on if no other view load has
+        started in the meantime, so a slow load never affects the view the user
+        switched to.
 
-            # Add to navigation list
-            self.current_category_posts.append(post)
+        Args:
+            on_result: Called on the GUI thread with the result of fn
+            fn: Blocking loading work, run on a worker thread
+            *args: Arguments for fn
+        """
+        load_id = self._cancel_view_load()
 
-            # Add post to view
-            self.subreddit_view.add_post(
-                post,
-                is_saved=True,
-                show_in_categories=True,
-                view_type="category",
+        def handle_result(result: Any):
+            if load_id == self._view_load_id:
+                on_result(result)
+
+        def handle_error(message: str):
+            if load_id == self._view_load_id:
+                QMessageBox.warning(
+                    self,
+                    "Load Error",
+                    f"An error occurred while loading posts: {message}",
+                )
+
+        worker = Worker(fn, *args)
+        worker.signals.result_ready.connect(handle_result)
+        worker.signals.error.connect(handle_error)
+        start_worker(worker)
+
+    def _cancel_view_load(self) -> int:
+        """
+        Discard the result of any view load still running.
+
+        Returns:
+            The id of the next view load
+        """
+        self._view_load_id += 1
+        return self._view_load_id
+
+    def _query_category_posts(self, category_name: str) -> List[RedditPost]:
+        """
+        Query the posts of a category. Runs on a worker thread.
+
+        Args:
+            category_name: Name of the category
+
+        Returns:
+            List of RedditPost objects, newest first
+        """
+        # sqlite3 connections are bound to their creating thread
+        conn = self.db.create_connection()
+        try:
+            # Select only the rendered columns and let SQLite convert the
+            # local-time added_date into a Unix timestamp
+            cursor = conn.execute(
+                """
+                SELECT sp.reddit_id, sp.title, sp.url, s.name,
+                       CAST(strftime('%s', sp.added_date, 'utc') AS INTEGER),
+                       sp.num_comments
+                FROM saved_posts sp
+                JOIN subreddits s ON sp.subreddit_id = s.id
+                WHERE sp.category = ? AND sp.show_in_categories = 1
+                ORDER BY sp.added_date DESC
+                """,
+                (category_name,),
             )
-            total_posts += 1
+
+            posts: List[RedditPost] = []
+            for (
+                reddit_id,
+                title,
+                url,
+                subreddit_name,
+                added_timestamp,
+                num_comments,
+            ) in cursor:
+                # Create post data from database row
+                posts.append(
+                    RedditPost(
+                        id=reddit_id,
+                        title=title,
+                        url=url,
+                        subreddit=subreddit_name,
+                        created_utc=added_timestamp,
+                        num_comments=num_comments,
+                        selftext="",
+                    )
+                )
+            return posts
+        finally:
+            conn.close()
+
+    def _show_category_posts(self, posts: List[RedditPost]):
+        """Display queried category posts."""
+        # Add to navigation list; every loaded post is shown in categories
+        self.current_category_posts = posts
+        self._category_post_positions = None
+        self._show_in_categories = {post.id: True for post in posts}
+
+        # Add posts to view in batches
+        self.subreddit_view.add_posts(
+            [(post, True) for post in posts], view_type="category"
+        )
 
         # Update window title with post count only
-        self.setWindowTitle(f"Reddit Explorer ({total_posts} posts)")
+        self.setWindowTitle(f"Reddit Explorer ({len(posts)} posts)")
 
     def _handle_next_click(self):
         """Handle Next button click - show next post in category."""
@@ -522,16 +680,12 @@ class RedditExplorer(QMainWindow):
             self.next_btn.setEnabled(False)
             return
 
-        print("INDEX BEFORE: ", self.current_post_index)
-
         self.current_post_index += 1
 
         # If we're at the last post or current index is invalid, start from beginning
         if self.current_post_index >= len(self.current_category_posts) - 1:
             self.current_post_index = 0
 
-        print("INDEX AFTER: ", self.current_post_index)
-
         # Safety check in case list is now empty
         if not self.current_category_posts:
             self.next_btn.setEnabled(False)
@@ -539,25 +693,25 @@ class RedditExplorer(QMainWindow):
 
         post = self.current_category_posts[self.current_post_index]
 
-        # Next button should always be enabled if we have posts
-        self.next_btn.setEnabled(True)
-
         # Update checkbox state
-        cursor = self.db.get_cursor()
-        cursor.execute(
-            "SELECT show_in_categories FROM saved_posts WHERE reddit_id = ?", (post.id,)
+        show_in_categories = self._show_in_categories.get(post.id)
+        if show_in_categories is not None:
+            # Block the checkbox signal while setting its state
+            self.browser_category_checkbox.blockSignals(True)
+            self.browser_category_checkbox.setChecked(show_in_categories)
+            self.browser_category_checkbox.blockSignals(False)
+
+        # Ignore rapid repeated clicks
+        self.next_btn.setEnabled(False)
+        QTimer.singleShot(
+            _NEXT_CLICK_DEBOUNCE_MS,
+            lambda: self.next_btn.setEnabled(bool(self.current_category_posts)),
         )
-        result = cursor.fetchone()
-        if result:
-            # Temporarily disconnect the checkbox signal
-            self.browser_category_checkbox.stateChanged.disconnect(
-                self._handle_browser_category_changed
-            )
-            self.browser_category_checkbox.setChecked(bool(result[0]))
-            # Reconnect the checkbox signal
-            self.browser_category_checkbox.stateChanged.connect(
-                self._handle_browser_category_changed
-            )
+
+        # Skip reloading when the post is already shown, e.g. after wrapping
+        match = _POST_ID_RE.search(self.browser.url().toString())
+        if match and match.group(1) == post.id:
+            return
 
         # Construct and load Reddit post URL
         post_url = f"https://www.reddit.com/r/{post.subreddit}/comments/{post.id}"
@@ -570,37 +724,25 @@ class RedditExplorer(QMainWindow):
 
         # Get current checkbox state before switching views
         show_in_categories = None
-        current_post_id = None
         if self.current_post_index >= 0 and self.current_post_index < len(
             self.current_category_posts
         ):
             post = self.current_category_posts[self.current_post_index]
-            current_post_id = post.id
-            cursor = self.db.get_cursor()
-            cursor.execute(
-                "SELECT show_in_categories FROM saved_posts WHERE reddit_id = ?",
-                (post.id,),
-            )
-            result = cursor.fetchone()
-            if result:
-                show_in_categories = bool(result[0])
+            show_in_categories = self._show_in_categories.get(post.id)
 
         # Store scroll position before switching views
         scroll_position = 0
         if self._current_view == "category":
             scroll_position = self.subreddit_view.verticalScrollBar().value()
 
-        # Hide browser and navigation buttons
-        self.browser.hide()
-        self.nav_buttons.hide()
-
-        # Show the appropriate view based on where we came from
+        # Hide browser and navigation buttons and show the appropriate view
+        # based on where we came from
         if self._current_view == "summary":
-            self.summarize_view.show()
+            self._show_views(self.summarize_view)
         elif self._current_view == "search":
-            self.search_view.show()
+            self._show_views(self.search_view)
         else:  # "subreddit" or "category"
-            self.subreddit_view.show()
+            self._show_views(self.subreddit_view)
 
         # Reset window title
         self.setWindowTitle("Reddit Explorer")
@@ -608,12 +750,9 @@ class RedditExplorer(QMainWindow):
         # Clear browser URL to prevent memory usage
         self.browser.setUrl("")
 
-        # If we were viewing a category, update only the changed post instead of reloading everything
+        # If we were viewing a category, keep it as is; posts hidden while
+        # browsing were already removed by the checkbox handler
         if self._current_category_name and self._current_view == "category":
-            if current_post_id and show_in_categories is not None:
-                # Update only the changed post
-                self._update_category_post(current_post_id, show_in_categories)
-
             # Restore scroll position
             self.subreddit_view.verticalScrollBar().setValue(scroll_position)
 
@@ -623,24 +762,11 @@ class RedditExplorer(QMainWindow):
 
     def _handle_browser_category_changed(self, state: int):
         """Handle category checkbox changes in browser view."""
-        # Get the current post ID based on the view we came from
-        post_id = None
-        if self._current_view == "category" and self.current_category_posts:
-            # Get the post ID from the URL instead of current_category_posts to avoid sync issues
-            url = self.browser.url().toString()
-            import re
-
-            match = re.search(r"/comments/([^/]+)/", url)
-            if match:
-                post_id = match.group(1)
-        else:
-            # For summary view or other views, get the post ID from the URL
-            url = self.browser.url().toString()
-            import re
-
-            match = re.search(r"/comments/([^/]+)/", url)
-            if match:
-                post_id = match.group(1)
+        # Get the post ID from the URL instead of current_category_posts to
+        # avoid sync issues; this works for every view we came from
+        url = self.browser.url().toString()
+        match = _POST_ID_RE.search(url)
+        post_id = match.group(1) if match else None
 
         if post_id:
             show_in_categories = state == 2
@@ -652,109 +778,257 @@ class RedditExplorer(QMainWindow):
 
                 # Update current_post_index to match the URL if needed
                 if not show_in_categories:
-                    url = self.browser.url().toString()
-                    match = re.search(r"/comments/([^/]+)/", url)
-                    if match:
-                        current_url_post_id = match.group(1)
-                        for i, post in enumerate(self.current_category_posts):
-                            if post.id == current_url_post_id:
-                                self.current_post_index = i
-                                break
-
-            # Refresh category counts after visibility change
-            self.refresh_category_counts()
+                    position = self.category_post_position(post_id)
+                    if position is not None:
+                        self.current_post_index = position
 
-    def save_post(self, post: RedditPost) -> None:
-        """Save a post to the database."""
-        cursor = self.db.get_cursor()
+    def _get_or_create_subreddit_id(
+        self, cursor: sqlite3.Cursor, subreddit: str
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Get a subreddit's id, adding the subreddit if it doesn't exist yet.
+
+        The tree is not updated here, since the transaction may still be rolled
+        back; callers add the new subreddit once it has been committed.
+
+        Args:
+            cursor: Cursor of the active transaction
+            subreddit: Subreddit name, matched case-insensitively
 
-        # Get subreddit id - using case-insensitive comparison
+        Returns:
+            Tuple of (database id, name to add to the tree or None if the
+            subreddit is already listed)
+        """
+        # Use the original case from our tree widget if the subreddit is known
+        existing_subreddit = self.explorer_model.find_name(SUBREDDITS, subreddit)
+        subreddit_name = existing_subreddit or subreddit
+
+        # Insert-or-get the subreddit id in a single statement
         cursor.execute(
-            "SELECT id FROM subreddits WHERE LOWER(name) = LOWER(?)", (post.subreddit,)
+            """
+            INSERT INTO subreddits (name) VALUES (?)
+            ON CONFLICT(name) DO UPDATE SET name = name
+            RETURNING id
+            """,
+            (subreddit_name,),
         )
-        result = cursor.fetchone()
-        if not result:
-            # Add subreddit if it doesn't exist - use the original case from our tree widget
-            root = self.tree.findItems("Subreddits", Qt.MatchFlag.MatchExactly)[0]
-            existing_subreddit = None
-            for i in range(root.childCount()):
-                if root.child(i).text(0).lower() == post.subreddit.lower():
-                    existing_subreddit = root.child(i).text(0)
-                    break
+        subreddit_id = cursor.fetchone()[0]
 
-            # If we found a matching subreddit, use its case, otherwise use the post's case
-            subreddit_name = existing_subreddit or post.subreddit
-            cursor.execute(
-                "INSERT INTO subreddits (name) VALUES (?)", (subreddit_name,)
-            )
-            subreddit_id = cursor.lastrowid
+        return subreddit_id, None if existing_subreddit else subreddit_name
 
-            # Add to tree if it's a new subreddit
-            if not existing_subreddit:
-                QTreeWidgetItem(self.subreddits_root, [subreddit_name])
-        else:
-            subreddit_id = result[0]
+    def save_post(self, post: RedditPost) -> None:
+        """Save a post to the database."""
+        # Format the post's creation time for SQLite
+        created_time = datetime.fromtimestamp(post.created_utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
+        cursor = self.db.get_cursor()
         try:
-            # Format the post's creation time for SQLite
-            created_time = datetime.fromtimestamp(post.created_utc).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            # Subreddit and post are written in a single transaction
+            with self.db.batch():
+                subreddit_id, new_subreddit = self._get_or_create_subreddit_id(
+                    cursor, post.subreddit
+                )
+                cursor.execute(
+                    f"INSERT {_INSERT_SAVED_POST_SQL}",
+                    (
+                        post.id,
+                        subreddit_id,
+                        post.title,
+                        post.url,
+                        post.num_comments,
+                        created_time,
+                        None,  # Content is downloaded in the background
+                    ),
+                )
+        except sqlite3.IntegrityError:
+            # Post already saved
+            return
 
-            # Try to download post content without showing progress
-            post_content = None
+        # Add to tree if it's a new subreddit
+        if new_subreddit:
+            self.explorer_model.add_item(SUBREDDITS, new_subreddit)
+
+        # New posts land in Uncategorized and are shown in categories
+        self.explorer_model.adjust_shown_count("Uncategorized", 1)
+
+        # Download post content without blocking or showing progress
+        if FETCH_CONTENT_ON_SAVE:
+            worker = Worker(self._fetch_post_content, post)
+            # Silently ignore failed downloads - the post stays without content
+            worker.signals.result_ready.connect(self._store_post_content)
+            start_worker(worker)
+
+    def _fetch_post_content(
+        self, post: RedditPost
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Download a post's content and comments, and with SUMMARIZE_ON_SAVE
+        also summarize it, so the summary is ready before it is asked for.
+        Runs on a worker thread.
+
+        Args:
+            post: The saved post
+
+        Returns:
+            Tuple of (post_id, content, summary)
+        """
+        content = self.reddit_service.fetch_post_details(post.subreddit, post.id)
+        summary = None
+        if SUMMARIZE_ON_SAVE and content:
             try:
-                post_content = self.reddit_service.fetch_post_details(
-                    post.subreddit, post.id
-                )
+                summary = self.ai_service.summarize_post(replace(post, content=content))
             except Exception:
-                # Silently continue if download fails - post will be saved without content
-                pass
+                pass  # The summary is optional; keep the downloaded content
+        return post.id, content, summary
 
+    def _store_post_content(self, result: Tuple[str, Optional[str], Optional[str]]):
+        """Store content, and any summary, downloaded for a saved post."""
+        post_id, content, summary = result
+        if self._closing or not content:
+            return
+        cursor = self.db.get_cursor()
+        cursor.execute(_UPDATE_POST_CONTENT_SQL, (content, post_id))
+        if summary:
             cursor.execute(
-                """
-                INSERT INTO saved_posts (reddit_id, subreddit_id, title, url, category, show_in_categories, is_read, num_comments, added_date, content, content_date)
-                VALUES (?, ?, ?, ?, 'Uncategorized', 1, 1, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                (
-                    post.id,
-                    subreddit_id,
-                    post.title,
-                    post.url,
-                    post.num_comments,
-                    created_time,
-                    post_content,  # This might be None if download failed
-                ),
+                "UPDATE saved_posts SET summary = ? WHERE reddit_id = ?",
+                (summary, post_id),
             )
-            self.db.commit()
+        self.db.commit()
 
-            # Refresh category counts after saving new post
-            self.refresh_category_counts()
+    def save_posts_bulk(self, posts: List[RedditPost]) -> None:
+        """
+        Save several posts to the database in a single transaction.
 
-        except sqlite3.IntegrityError:
-            # Post already saved
-            pass
+        Post content is not downloaded; use "Download posts" on the category
+        afterwards. Posts that are already saved are skipped.
+
+        Args:
+            posts: Posts to save
+        """
+        cursor = self.db.get_cursor()
+        subreddit_ids: Dict[str, int] = {}
+        # Subreddits added by this batch as lowercased name -> (name, id), so
+        # differently cased names of a new subreddit share its row
+        new_subreddits: Dict[str, Tuple[str, int]] = {}
+        with self.db.batch():
+            for subreddit in {post.subreddit for post in posts}:
+                new_subreddit = new_subreddits.get(subreddit.lower())
+                if new_subreddit:
+                    subreddit_ids[subreddit] = new_subreddit[1]
+                    continue
+                subreddit_id, name = self._get_or_create_subreddit_id(cursor, subreddit)
+                subreddit_ids[subreddit] = subreddit_id
+                if name:
+                    new_subreddits[subreddit.lower()] = (name, subreddit_id)
+            cursor.executemany(
+                f"INSERT OR IGNORE {_INSERT_SAVED_POST_SQL}",
+                [
+                    (
+                        post.id,
+                        subreddit_ids[post.subreddit],
+                        post.title,
+                        post.url,
+                        post.num_comments,
+                        datetime.fromtimestamp(post.created_utc).strftime(
+                            "%Y-%m-%d %H:%M:%S"
+                        ),
+                        None,
+                    )
+                    for post in posts
+                ],
+            )
+
+            # New posts land in Uncategorized; already saved ones were ignored
+            inserted = cursor.rowcount
+
+        # Add new subreddits to the tree now that they are committed
+        for subreddit, _ in new_subreddits.values():
+            self.explorer_model.add_item(SUBREDDITS, subreddit)
+
+        self.explorer_model.adjust_shown_count("Uncategorized", inserted)
 
     def unsave_post(self, post: RedditPost) -> None:
         """Remove a post from saved posts."""
         cursor = self.db.get_cursor()
+        cursor.execute(
+            "SELECT category, show_in_categories FROM saved_posts WHERE reddit_id = ?",
+            (post.id,),
+        )
+        result = cursor.fetchone()
         cursor.execute("DELETE FROM saved_posts WHERE reddit_id = ?", (post.id,))
         self.db.commit()
 
-        # Refresh category counts after deleting the post
-        self.refresh_category_counts()
+        # Only posts shown in categories contribute to the category count
+        if result and result[1]:
+            self.explorer_model.adjust_shown_count(result[0], -1)
 
     def update_post_category_visibility(
         self, post_id: str, show_in_categories: bool
     ) -> None:
         """Update whether a post should be shown in categories view."""
+        show = 1 if show_in_categories else 0
+        cursor = self.db.get_cursor()
+        cursor.execute(_SET_SHOW_IN_CATEGORIES_SQL, (show, post_id, show))
+        result = cursor.fetchone()
+        self.db.commit()
+
+        # Keep the in-memory state of the loaded category posts in sync
+        if post_id in self._show_in_categories:
+            self._show_in_categories[post_id] = show_in_categories
+
+        # Adjust the cached count only when the visibility actually changed
+        if result:
+            self.explorer_model.adjust_shown_count(
+                result[0], 1 if show_in_categories else -1
+            )
+
+    def set_post_category(self, post_id: str, category_name: str) -> None:
+        """Move a saved post to another category."""
         cursor = self.db.get_cursor()
         cursor.execute(
-            "UPDATE saved_posts SET show_in_categories = ? WHERE reddit_id = ?",
-            (1 if show_in_categories else 0, post_id),
+            "SELECT category, show_in_categories FROM saved_posts WHERE reddit_id = ?",
+            (post_id,),
+        )
+        result = cursor.fetchone()
+        cursor.execute(
+            "UPDATE saved_posts SET category = ? WHERE reddit_id = ?",
+            (category_name, post_id),
         )
         self.db.commit()
 
+        # Move the post's contribution to the category counts
+        if result and result[1] and result[0] != category_name:
+            self.explorer_model.adjust_count(result[0], -1)
+            self.explorer_model.adjust_count(category_name, 1)
+
+    def get_categories(self) -> List[str]:
+        """Get the names of all categories, in display order."""
+        # The explorer model is kept in step with the categories table
+        return list(self.explorer_model.names(CATEGORIES))
+
+    def get_category_menu(self) -> QMenu:
+        """
+        Get the menu of categories to move a post to.
+
+        The menu is shared by all post widgets and only rebuilt when the
+        categories have changed. Each action's data is its category name.
+
+        Returns:
+            The category menu
+        """
+        categories = self.get_categories()
+        if self._category_menu is None:
+            self._category_menu = QMenu(self)
+        if categories != self._category_menu_names:
+            self._category_menu.clear()
+            for category in categories:
+                action = self._category_menu.addAction(category)
+                action.setData(category)
+            self._category_menu_names = categories
+        return self._category_menu
+
     def add_subreddit(self, subreddit_name: str) -> None:
         """Add a new subreddit to database and tree."""
         cursor = self.db.get_cursor()
@@ -763,7 +1037,7 @@ class RedditExplorer(QMainWindow):
                 "INSERT INTO subreddits (name) VALUES (?)", (subreddit_name,)
             )
             self.db.commit()
-            QTreeWidgetItem(self.subreddits_root, [subreddit_name])
+            self.explorer_model.add_item(SUBREDDITS, subreddit_name)
         except sqlite3.IntegrityError:
             # Subreddit already exists
             pass
@@ -781,14 +1055,6 @@ class RedditExplorer(QMainWindow):
             if not name:  # Check if name is empty after cleaning
                 return
 
-            # Find the correct position to insert alphabetically
-            insert_pos = 0
-            for i in range(self.subreddits_root.childCount()):
-                item = self.subreddits_root.child(i)
-                if name.lower() < item.text(0).lower():
-                    break
-                insert_pos = i + 1
-
             try:
                 # Add to database
                 cursor = self.db.get_cursor()
@@ -796,17 +1062,13 @@ class RedditExplorer(QMainWindow):
                 self.db.commit()
 
                 # Insert at the correct position
-                QTreeWidgetItem(self.subreddits_root)  # Create empty item
-                self.subreddits_root.insertChild(insert_pos, QTreeWidgetItem([name]))
-                self.subreddits_root.takeChild(
-                    self.subreddits_root.childCount() - 1
-                )  # Remove empty item
+                self.explorer_model.add_item(SUBREDDITS, name)
 
             except sqlite3.IntegrityError:
                 # Subreddit already exists
                 pass
 
-    def _rename_category(self, item: QTreeWidgetItem, old_name: str):
+    def _rename_category(self, old_name: str):
         """Show dialog to rename a category."""
         new_name, ok = QInputDialog.getText(
             self, "Rename Category", "Enter new category name:", text=old_name
@@ -821,42 +1083,25 @@ class RedditExplorer(QMainWindow):
             cursor = self.db.get_cursor()
             try:
                 # Update in database
-                cursor.execute(
-                    "UPDATE categories SET name = ? WHERE name = ?",
-                    (new_name, old_name),
-                )
-                cursor.execute(
-                    "UPDATE saved_posts SET category = ? WHERE category = ?",
-                    (new_name, old_name),
-                )
-                self.db.commit()
-
-                # Update tree item
-                post_count = (
-                    item.text(0).split(" (")[1].rstrip(")")
-                )  # Get count from display text
-                item.setText(0, f"{new_name} ({post_count})")
-
-                # Move item to maintain alphabetical order
-                parent = item.parent()
-                current_index = parent.indexOfChild(item)
-                parent.takeChild(current_index)
-
-                # Find new position
-                insert_pos = 0
-                for i in range(parent.childCount()):
-                    current_name = parent.child(i).text(0).split(" (")[0]
-                    if new_name.lower() < current_name.lower():
-                        break
-                    insert_pos = i + 1
+                with self.db.batch():
+                    cursor.execute(
+                        "UPDATE categories SET name = ? WHERE name = ?",
+                        (new_name, old_name),
+                    )
+                    cursor.execute(
+                        "UPDATE saved_posts SET category = ? WHERE category = ?",
+                        (new_name, old_name),
+                    )
+                self._category_descriptions = None
 
-                parent.insertChild(insert_pos, item)
+                # Update tree item, moving it to maintain alphabetical order
+                self.explorer_model.rename_item(CATEGORIES, old_name, new_name)
 
             except sqlite3.IntegrityError:
                 # Category name already exists
                 pass
 
-    def _rename_subreddit(self, item: QTreeWidgetItem, old_name: str):
+    def _rename_subreddit(self, old_name: str):
         """Show dialog to rename a subreddit."""
         new_name, ok = QInputDialog.getText(
             self, "Rename Subreddit", "Enter new subreddit name:", text=old_name
@@ -880,28 +1125,14 @@ class RedditExplorer(QMainWindow):
                 )
                 self.db.commit()
 
-                # Update tree item
-                item.setText(0, new_name)
-
-                # Move item to maintain alphabetical order
-                parent = item.parent()
-                current_index = parent.indexOfChild(item)
-                parent.takeChild(current_index)
-
-                # Find new position
-                insert_pos = 0
-                for i in range(parent.childCount()):
-                    if new_name.lower() < parent.child(i).text(0).lower():
-                        break
-                    insert_pos = i + 1
-
-                parent.insertChild(insert_pos, item)
+                # Update tree item, moving it to maintain alphabetical order
+                self.explorer_model.rename_item(SUBREDDITS, old_name, new_name)
 
             except sqlite3.IntegrityError:
                 # Subreddit name already exists
                 pass
 
-    def _remove_category(self, item: QTreeWidgetItem, category_name: str):
+    def _remove_category(self, category_name: str):
         """Remove a category after confirmation."""
         # Show confirmation dialog
         reply = QMessageBox.question(
@@ -915,29 +1146,28 @@ class RedditExplorer(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             cursor = self.db.get_cursor()
             try:
-                # Move posts to Uncategorized
-                cursor.execute(
-                    "UPDATE saved_posts SET category = 'Uncategorized' WHERE category = ?",
-                    (category_name,),
-                )
-                # Remove the category
-                cursor.execute(
-                    "DELETE FROM categories WHERE name = ?", (category_name,)
-                )
-                self.db.commit()
-
-                # Remove from tree
-                parent = item.parent()
-                parent.takeChild(parent.indexOfChild(item))
+                with self.db.batch():
+                    # Move posts to Uncategorized
+                    cursor.execute(
+                        "UPDATE saved_posts SET category = 'Uncategorized' WHERE category = ?",
+                        (category_name,),
+                    )
+                    # Remove the category
+                    cursor.execute(
+                        "DELETE FROM categories WHERE name = ?", (category_name,)
+                    )
+                self._category_descriptions = None
 
-                # Refresh category counts to update Uncategorized
-                self.refresh_category_counts()
+                # Remove from tree, moving its count to Uncategorized
+                moved = self.explorer_model.count(category_name)
+                self.explorer_model.remove_item(CATEGORIES, category_name)
+                self.explorer_model.adjust_count("Uncategorized", moved)
 
             except sqlite3.Error:
                 # Handle database error
                 pass
 
-    def _uncategorize_posts(self, item: QTreeWidgetItem, category_name: str):
+    def _uncategorize_posts(self, category_name: str):
         """Move all posts from a category to Uncategorized after confirmation."""
         # Show confirmation dialog
         reply = QMessageBox.question(
@@ -958,8 +1188,10 @@ class RedditExplorer(QMainWindow):
                 )
                 self.db.commit()
 
-                # Refresh category counts to update both categories
-                self.refresh_category_counts()
+                # Move the category's count to Uncategorized
+                moved = self.explorer_model.count(category_name)
+                self.explorer_model.set_count(category_name, 0)
+                self.explorer_model.adjust_count("Uncategorized", moved)
 
                 # If we're currently viewing this category, switch to Uncategorized
                 if self._current_category_name == category_name:
@@ -970,41 +1202,40 @@ class RedditExplorer(QMainWindow):
                 pass
 
     def refresh_category_counts(self):
+        """
+        Schedule a refresh of the category counts in the tree widget.
+
+        Refreshes requested within the same event loop iteration are coalesced
+        into a single query.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh_category_counts)
+
+    def _do_refresh_category_counts(self):
         """Refresh the category counts in the tree widget."""
+        self._refresh_pending = False
         cursor = self.db.get_cursor()
 
-        # Get current category counts
+        # Get current category counts, each row also carrying the total
+        # number of posts shown in categories for "Most popular", including
+        # posts whose category has no row in categories
         cursor.execute(
             """
-            SELECT c.name, COUNT(sp.id) as post_count 
+            SELECT c.name, COUNT(sp.id) as post_count,
+                   (SELECT COUNT(*) FROM saved_posts
+                    WHERE show_in_categories = 1) as total_posts
             FROM categories c 
             LEFT JOIN saved_posts sp ON sp.category = c.name AND sp.show_in_categories = 1
-            GROUP BY c.name 
-            ORDER BY c.name
-            """
-        )
-        category_counts = {row[0]: row[1] for row in cursor.fetchall()}
-
-        # Get total number of posts that show in categories for "Most popular"
-        cursor.execute(
-            """
-            SELECT COUNT(*) 
-            FROM saved_posts 
-            WHERE show_in_categories = 1
+            GROUP BY c.name
             """
         )
-        total_posts = cursor.fetchone()[0]
-        most_popular_count = min(200, total_posts)
+        rows = cursor.fetchall()
+        category_counts = {row[0]: row[1] for row in rows}
+        total_posts = rows[0][2] if rows else 0
 
         # Update tree items
-        for i in range(self.categories_root.childCount()):
-            item = self.categories_root.child(i)
-            category_name = item.text(0).split(" (")[0]  # Get name without count
-            if category_name == "Most popular":
-                item.setText(0, f"Most popular ({most_popular_count})")
-            else:
-                count = category_counts.get(category_name, 0)
-                item.setText(0, f"{category_name} ({count})")
+        self.explorer_model.set_counts(category_counts, total_posts)
 
     def _analyze_category_posts(self, category_name: str):
         """Analyze all unanalyzed posts in a category."""
@@ -1030,6 +1261,68 @@ class RedditExplorer(QMainWindow):
             )
             return
 
+        if self._download_posts_with_progress(posts):
+            QMessageBox.information(
+                self,
+                "Download Complete",
+                f"Successfully downloaded {len(posts)} posts in {category_name}.",
+            )
+
+    def _collect_with_progress(
+        self,
+        futures: Dict["Future[Any]", str],
+        progress: QProgressDialog,
+        label: str,
+    ) -> Tuple[List[Tuple[Any, str]], Optional[Exception]]:
+        """
+        Collect the results of running futures, showing progress.
+
+        Waits in steps of _PROGRESS_UPDATE_INTERVAL, processing events and
+        checking for a cancel after each step, so the dialog stays responsive
+        however long a single future takes.
+
+        Args:
+            futures: Running futures, each mapped to its reddit_id
+            progress: Progress dialog to update; cancelling it stops waiting
+            label: Progress label, e.g. "Downloaded post"
+
+        Returns:
+            Tuple of (results, error): (result, reddit_id) pairs of the futures
+            finished before all were done, a cancel or an error, and the error
+            if one occurred
+        """
+        results: List[Tuple[Any, str]] = []
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=_PROGRESS_UPDATE_INTERVAL)
+                for future in done:
+                    results.append((future.result(), futures[future]))
+                if done:
+                    progress.setValue(len(results))
+                    progress.setLabelText(
+                        f"{label} {len(results)} of {len(futures)}..."
+                    )
+                QApplication.processEvents()
+                if progress.wasCanceled():
+                    break
+        except Exception as e:
+            return results, e
+        return results, None
+
+    def _download_posts_with_progress(self, posts: List[Tuple[str, str]]) -> bool:
+        """
+        Download and store the content of several posts, showing progress.
+
+        Posts are downloaded in parallel and stored in a single transaction,
+        including the ones finished before a cancel or an error.
+
+        Args:
+            posts: Tuples of (reddit_id, subreddit_name)
+
+        Returns:
+            True if every post was downloaded, False if cancelled or failed
+        """
         # Create progress dialog
         progress = QProgressDialog(
             "Downloading posts...", "Cancel", 0, len(posts), self
@@ -1038,50 +1331,41 @@ class RedditExplorer(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)  # Show immediately
 
+        executor = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+        futures = {
+            executor.submit(
+                self.reddit_service.fetch_post_details, subreddit_name, reddit_id
+            ): reddit_id
+            for reddit_id, subreddit_name in posts
+        }
         try:
-            # Analyze each post
-            for i, post in enumerate(posts):
-                if progress.wasCanceled():
-                    break
-
-                reddit_id = post[0]
-                subreddit_name = post[1]
-
-                # Update progress
-                progress.setValue(i)
-                progress.setLabelText(f"Downloading post {i + 1} of {len(posts)}...")
-
-                # Fetch and store analysis
-                analysis = self.reddit_service.fetch_post_details(
-                    subreddit_name, reddit_id
-                )
-                cursor.execute(
-                    """
-                    UPDATE saved_posts 
-                    SET content = ?, content_date = CURRENT_TIMESTAMP
-                    WHERE reddit_id = ?
-                    """,
-                    (analysis, reddit_id),
-                )
-                self.db.commit()
-
-            # Ensure progress dialog is closed
-            progress.setValue(len(posts))
+            # Downloaded (content, reddit_id) pairs
+            downloaded, error = self._collect_with_progress(
+                futures, progress, "Downloaded post"
+            )
+        finally:
+            # Drop downloads that haven't started; running ones finish in the
+            # background
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            if not progress.wasCanceled():
-                QMessageBox.information(
-                    self,
-                    "Download Complete",
-                    f"Successfully downloaded {len(posts)} posts in {category_name}.",
-                )
+        if downloaded:
+            with self.db.batch():
+                self.db.get_cursor().executemany(_UPDATE_POST_CONTENT_SQL, downloaded)
 
-        except Exception as e:
+        if error is not None:
             progress.cancel()  # Ensure progress dialog is closed on error
             QMessageBox.warning(
                 self,
                 "Download Error",
-                f"An error occurred while downloading posts: {str(e)}",
+                f"An error occurred while downloading posts: {str(error)}",
             )
+            return False
+        if progress.wasCanceled():
+            return False
+
+        # Ensure progress dialog is closed
+        progress.setValue(len(posts))
+        return True
 
     def _auto_categorize_posts(self, category_name: str):
         """Auto-categorize all analyzed posts in a category using AI."""
@@ -1100,54 +1384,10 @@ class RedditExplorer(QMainWindow):
         undownloaded_posts = cursor.fetchall()
 
         # If there are undownloaded posts, download them first
-        if undownloaded_posts:
-            # Create progress dialog for downloading
-            download_progress = QProgressDialog(
-                "Downloading posts...", "Cancel", 0, len(undownloaded_posts), self
-            )
-            download_progress.setWindowTitle("Downloading Posts")
-            download_progress.setWindowModality(Qt.WindowModality.WindowModal)
-            download_progress.setMinimumDuration(0)
-
-            try:
-                # Download each post
-                for i, post in enumerate(undownloaded_posts):
-                    if download_progress.wasCanceled():
-                        return
-
-                    reddit_id = post[0]
-                    subreddit_name = post[1]
-
-                    # Update progress
-                    download_progress.setValue(i)
-                    download_progress.setLabelText(
-                        f"Downloading post {i + 1} of {len(undownloaded_posts)}..."
-                    )
-
-                    # Fetch and store content
-                    content = self.reddit_service.fetch_post_details(
-                        subreddit_name, reddit_id
-                    )
-                    cursor.execute(
-                        """
-                        UPDATE saved_posts 
-                        SET content = ?, content_date = CURRENT_TIMESTAMP
-                        WHERE reddit_id = ?
-                        """,
-                        (content, reddit_id),
-                    )
-                    self.db.commit()
-
-                download_progress.setValue(len(undownloaded_posts))
-
-            except Exception as e:
-                download_progress.cancel()
-                QMessageBox.warning(
-                    self,
-                    "Download Error",
-                    f"An error occurred while downloading posts: {str(e)}",
-                )
-                return
+        if undownloaded_posts and not self._download_posts_with_progress(
+            undownloaded_posts
+        ):
+            return
 
         # Now get all posts with content for categorization
         cursor.execute(
@@ -1170,8 +1410,7 @@ class RedditExplorer(QMainWindow):
             return
 
         # Get all categories and their descriptions
-        cursor.execute("SELECT name, description FROM categories")
-        categories = {row[0]: row[1] for row in cursor.fetchall()}
+        categories = self._get_category_descriptions()
 
         # Create progress dialog for categorization
         progress = QProgressDialog(
@@ -1181,6 +1420,9 @@ class RedditExplorer(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
 
+        # (category, summary, reddit_id) of changed posts, stored at the end
+        updates: List[Tuple[str, str, str]] = []
+        error: Optional[Exception] = None
         try:
             # Process each post
             for i, post_data in enumerate(posts):
@@ -1209,35 +1451,43 @@ class RedditExplorer(QMainWindow):
 
                 # Update category and summary if different
                 if suggested_category != category_name or not post_data[4]:
-                    cursor.execute(
-                        "UPDATE saved_posts SET category = ?, summary = ? WHERE reddit_id = ?",
-                        (suggested_category, summary, post.id),
-                    )
-                    self.db.commit()
-
-            # Ensure progress dialog is closed
-            progress.setValue(len(posts))
-
-            if not progress.wasCanceled():
-                # Refresh category counts
-                self.refresh_category_counts()
-
-                # If we're currently viewing this category, reload it
-                if self._current_category_name == category_name:
-                    self.load_category_posts(category_name)
-
-                QMessageBox.information(
-                    self,
-                    "Auto-categorize Complete",
-                    f"Successfully processed {len(posts)} posts.",
+                    updates.append((suggested_category, summary, post.id))
+        except Exception as e:
+            error = e
+
+        # Store all changes in one transaction, including posts processed
+        # before a cancel or an error
+        if updates:
+            with self.db.batch():
+                cursor.executemany(
+                    "UPDATE saved_posts SET category = ?, summary = ? WHERE reddit_id = ?",
+                    updates,
                 )
 
-        except Exception as e:
+            # Refresh category counts
+            self.refresh_category_counts()
+
+        if error is not None:
             progress.cancel()  # Ensure progress dialog is closed on error
             QMessageBox.warning(
                 self,
                 "Auto-categorize Error",
-                f"An error occurred while categorizing posts: {str(e)}",
+                f"An error occurred while categorizing posts: {str(error)}",
+            )
+            return
+
+        # Ensure progress dialog is closed
+        progress.setValue(len(posts))
+
+        if not progress.wasCanceled():
+            # If we're currently viewing this category, reload it
+            if self._current_category_name == category_name:
+                self.load_category_posts(category_name)
+
+            QMessageBox.information(
+                self,
+                "Auto-categorize Complete",
+                f"Successfully processed {len(posts)} posts.",
             )
 
     def get_current_category(self) -> Optional[str]:
@@ -1253,60 +1503,63 @@ class RedditExplorer(QMainWindow):
             post_count: Number of posts to display
         """
         # Clear and hide browser and navigation buttons, show subreddit view
-        self.browser.hide()
-        self.nav_buttons.hide()
-        self.summarize_view.hide()  # Hide summary view
-        self.search_view.hide()  # Hide search view
-        self.subreddit_view.show()
+        self._show_views(self.subreddit_view)
         self.subreddit_view.clear()
 
-        # Reset window title
-        self.setWindowTitle("Reddit Explorer")
-
-        # Get list of saved post IDs for this subreddit
-        cursor = self.db.get_cursor()
-        cursor.execute(
-            """
-            SELECT reddit_id FROM saved_posts sp
-            JOIN subreddits s ON sp.subreddit_id = s.id
-            WHERE s.name = ?
-            """,
-            (subreddit_name,),
+        # Fetch posts from Reddit on a worker thread
+        self._start_view_load(
+            lambda posts: self._show_subreddit_posts(
+                posts, self._saved_post_ids([post.id for post in posts])
+            ),
+            self._fetch_fixed_subreddit_posts,
+            subreddit_name,
+            post_count,
         )
-        saved_posts = {row[0] for row in cursor.fetchall()}
 
-        # Fetch posts from Reddit
+    def _fetch_fixed_subreddit_posts(
+        self, subreddit_name: str, post_count: int
+    ) -> List[RedditPost]:
+        """
+        Fetch a fixed number of posts. Runs on a worker thread.
+
+        Args:
+            subreddit_name: Name of the subreddit
+            post_count: Number of posts to fetch
+
+        Returns:
+            List of RedditPost objects, oldest first
+        """
         posts = self.reddit_service.fetch_all_subreddit_posts(
             subreddit_name, post_count
         )
 
         # Reverse posts to show oldest first
         posts.reverse()
+        return posts[:post_count]
 
-        # Add posts to view
-        total_posts = 0
-        for post in posts:
-            is_saved = post.id in saved_posts
-            self.subreddit_view.add_post(post, is_saved, view_type="subreddit")
-            total_posts += 1
-
-            if total_posts >= post_count:  # Stop when we hit the requested count
-                break
+    def _saved_post_ids(self, post_ids: List[str]) -> Set[str]:
+        """
+        Get which of the given posts are saved.
 
-        # Update window title with post count
-        self.setWindowTitle(f"Reddit Explorer ({total_posts} posts)")
+        Args:
+            post_ids: Reddit post IDs
 
-        # Scroll to top
-        self.subreddit_view.verticalScrollBar().setValue(0)
+        Returns:
+            The saved post IDs among post_ids
+        """
+        # Pass the IDs as one JSON array to stay clear of the variable limit
+        cursor = self.db.get_cursor()
+        cursor.execute(
+            "SELECT reddit_id FROM saved_posts WHERE reddit_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(post_ids),),
+        )
+        return {row[0] for row in cursor}
 
     def _load_summarize_view(self, time_period: str):
         """Load and display the summarize view for a time period."""
         # Hide other views
-        self.browser.hide()
-        self.nav_buttons.hide()
-        self.subreddit_view.hide()
-        self.search_view.hide()  # Hide search view
-        self.summarize_view.show()
+        self._show_views(self.summarize_view)
+        self._cancel_view_load()
         self._current_view = "summary"  # Set current view to summary
 
         # Check if we have cached summaries
@@ -1342,10 +1595,11 @@ class RedditExplorer(QMainWindow):
             # Add more time periods here as needed
             return
 
-        # Get posts from the time period
+        # Get posts from the time period, both with and without summaries
         cursor.execute(
             """
-            SELECT sp.reddit_id, sp.title, sp.url, sp.content, sp.num_comments, sp.added_date, sp.summary,
+            SELECT sp.reddit_id, sp.title, sp.url, sp.content, sp.num_comments,
+                   CAST(strftime('%s', sp.added_date, 'utc') AS INTEGER), sp.summary,
                    s.name as subreddit_name
             FROM saved_posts sp
             JOIN subreddits s ON sp.subreddit_id = s.id
@@ -1356,6 +1610,9 @@ class RedditExplorer(QMainWindow):
         )
         rows = cursor.fetchall()
 
+        # Summary per post, newest first; missing ones are generated below
+        post_summaries: Dict[str, Optional[str]] = {}
+
         # Create list of posts that need summaries
         posts_to_summarize: List[RedditPost] = []
         for row in rows:
@@ -1366,24 +1623,26 @@ class RedditExplorer(QMainWindow):
                 url,
                 content,
                 num_comments,
-                added_date,
+                added_timestamp,
                 summary,
                 subreddit_name,
             ) = row
+            post_summaries[reddit_id] = summary
+
+            # Posts that already have a summary are skipped without parsing
+            if summary:
+                continue
 
             post = RedditPost(
                 id=reddit_id,
                 title=title,
                 url=url,
                 subreddit=subreddit_name,
-                created_utc=datetime.strptime(
-                    added_date, "%Y-%m-%d %H:%M:%S"
-                ).timestamp(),
+                created_utc=added_timestamp,
                 num_comments=num_comments,
                 selftext=content or "",
             )
-            if not summary:
-                posts_to_summarize.append(post)
+            posts_to_summarize.append(post)
 
         # Generate missing summaries
         if posts_to_summarize:
@@ -1398,45 +1657,34 @@ class RedditExplorer(QMainWindow):
             progress.setWindowModality(Qt.WindowModality.WindowModal)
             progress.show()
 
-            for i, post in enumerate(posts_to_summarize):
-                progress.setValue(i)
-                progress.setLabelText(
-                    f"Generating summary {i + 1} of {len(posts_to_summarize)}..."
-                )
-
-                # Generate summary using AI service
-                summary = self.ai_service.summarize_post(post)
+            generated, error = self._summarize_posts(
+                posts_to_summarize, progress, "Generating summary"
+            )
 
-                # Save summary to database
-                cursor.execute(
-                    "UPDATE saved_posts SET summary = ? WHERE reddit_id = ?",
-                    (summary, post.id),
-                )
-                self.db.commit()
+            # Save the generated summaries in one transaction
+            self._store_summaries(generated)
 
             progress.close()
+            if error is not None:
+                raise error
 
-        # Get all posts with summaries
-        cursor.execute(
-            """
-            SELECT sp.reddit_id, sp.summary
-            FROM saved_posts sp
-            JOIN subreddits s ON sp.subreddit_id = s.id
-            WHERE sp.added_date >= ? AND sp.summary IS NOT NULL
-            ORDER BY sp.added_date DESC
-            """,
-            (cutoff_time.strftime("%Y-%m-%d %H:%M:%S"),),
-        )
-        rows = cursor.fetchall()
+            for summary, post_id in generated:
+                post_summaries[post_id] = summary
 
-        if not rows:
+        # Get all posts with summaries, as (summary, post_id)
+        summaries = [
+            (summary, post_id)
+            for post_id, summary in post_summaries.items()
+            if summary is not None
+        ]
+
+        if not summaries:
             self.summarize_view.display_summaries(
                 time_period, [("No posts found in this time period.", "")]
             )
             return
 
         # Generate bullet points from summaries using AI
-        summaries = [(row[1], row[0]) for row in rows]  # (summary, post_id)
         bullet_points = self.ai_service.generate_bullet_points(summaries)
 
         # Display the bullet points
@@ -1463,11 +1711,7 @@ class RedditExplorer(QMainWindow):
             post_url = f"https://www.reddit.com/r/{subreddit_name}/comments/{post_id}"
 
             # Show browser and navigation buttons
-            self.browser.show()
-            self.nav_buttons.show()
-            self.subreddit_view.hide()
-            self.summarize_view.hide()
-            self.search_view.hide()  # Hide search view
+            self._show_views(self.browser, self.nav_buttons)
 
             # Set the checkbox state based on the database value
             self.browser_category_checkbox.setChecked(bool(show_in_categories))
@@ -1475,109 +1719,71 @@ class RedditExplorer(QMainWindow):
             # Load the URL
             self.browser.load_url(post_url, lambda ok: self.browser.hide_sidebar())
 
+    def category_post_position(self, post_id: str) -> Optional[int]:
+        """
+        Get the position of a post in current_category_posts.
+
+        The position index is rebuilt on first use after the list changes.
+
+        Args:
+            post_id: Reddit post ID
+
+        Returns:
+            The post's position, or None if it isn't in the list
+        """
+        if self._category_post_positions is None:
+            self._category_post_positions = {
+                post.id: i for i, post in enumerate(self.current_category_posts)
+            }
+        return self._category_post_positions.get(post_id)
+
     def _update_category_post(self, post_id: str, show_in_categories: bool):
         """
         Update a single post in the category view without reloading all posts.
         """
-        print(
-            "Updating category post ",
-            post_id,
-            " with show_in_categories ",
-            show_in_categories,
-        )
         # Check if the post is in the current category posts list
+        i = self.category_post_position(post_id)
+        if i is None:
+            return
 
-        for i, post in enumerate(self.current_category_posts):
-            if post.id == post_id:
-                print("Post found in list, ", post.id)
-
-                # If show_in_categories is False, remove the post from the list and view
-                print("SHOW IN CATEGORIES", show_in_categories)
-                if not show_in_categories:
-                    # Remove the post from the list
-                    a = self.current_category_posts.pop(i)
-
-                    # Remove the post widget from the view
-                    self.subreddit_view.remove_post_widget(post_id)
-
-                    print("REMOVED", a)
+        post = self.current_category_posts[i]
 
-                    # Update current_post_index if needed
-                    self.current_post_index -= 1
+        # If show_in_categories is False, remove the post from the list and view
+        if not show_in_categories:
+            # Remove the post from the list
+            self.current_category_posts.pop(i)
+            self._category_post_positions = None
 
-                    break
-                else:
-                    print("ADDING POST TO VIEW")
-                    self.current_category_posts.append(post)
-
-                    self.subreddit_view.add_post(
-                        post,
-                        is_saved=True,
-                        show_in_categories=True,
-                        view_type="category",
-                    )
-                    break
+            # Remove the post widget from the view
+            self.subreddit_view.remove_post_widget(post_id)
 
-        # If the post is not in the list but should be shown in categories,
-        # we need to add it (this happens when changing from not showing to showing)
-        if (
-            False
-        ):  # not post_in_list and show_in_categories and self._current_category_name:
-            print("Post not in list but should be shown in categories")
-            cursor = self.db.get_cursor()
+            # Update current_post_index if needed
+            self.current_post_index -= 1
+        else:
+            self.current_category_posts.append(post)
+            self._category_post_positions = None
 
-            # Remove special handling for "Most popular" category
-            cursor.execute(
-                """
-                SELECT sp.*, s.name as subreddit_name
-                FROM saved_posts sp
-                JOIN subreddits s ON sp.subreddit_id = s.id
-                WHERE sp.reddit_id = ? AND sp.category = ? AND sp.show_in_categories = 1
-                """,
-                (post_id, self._current_category_name),
+            self.subreddit_view.add_post(
+                post,
+                is_saved=True,
+                show_in_categories=True,
+                view_type="category",
             )
 
-            row = cursor.fetchone()
-
-            if row:
-                # Create post data from database row
-                post = RedditPost(
-                    id=row[1],  # reddit_id
-                    title=row[3],  # title
-                    url=row[4],  # url
-                    subreddit=row[-1],  # subreddit_name (last column)
-                    created_utc=datetime.strptime(
-                        row[9], "%Y-%m-%d %H:%M:%S"  # added_date
-                    ).timestamp(),
-                    num_comments=row[8],  # num_comments
-                    selftext="",
-                )
-                print("Post created", post)
-
-                # Add to navigation list
-                self.current_category_posts.append(post)
-
-                # Add post to view
-                self.subreddit_view.add_post(
-                    post,
-                    is_saved=True,
-                    show_in_categories=True,
-                    view_type="category",
-                )
-
-        # Refresh category counts
-        self.refresh_category_counts()
-
     def regenerate_summaries(self):
         """Regenerate summaries that were previously marked as having insufficient information."""
         cursor = self.db.get_cursor()
 
-        # Find all posts with incomplete summaries
+        # Find all posts with incomplete summaries; posts without downloaded
+        # content have nothing to summarize
         cursor.execute(
             """
-            SELECT sp.reddit_id, sp.title, sp.url, sp.content, sp.num_comments, sp.added_date, s.name as subreddit_name
+            SELECT sp.reddit_id, sp.title, sp.url, sp.content, sp.num_comments,
+                   CAST(strftime('%s', sp.added_date, 'utc') AS INTEGER), s.name as subreddit_name,
+                   sp.summary
             FROM saved_posts sp
             JOIN subreddits s ON sp.subreddit_id = s.id
+            WHERE sp.content IS NOT NULL
         """
         )
         rows = cursor.fetchall()
@@ -1593,57 +1799,94 @@ class RedditExplorer(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.show()
 
-        try:
-            for i, row in enumerate(rows):
-                if progress.wasCanceled():
-                    break
-
-                # Update progress
-                progress.setValue(i)
-                progress.setLabelText(f"Regenerating summary {i + 1} of {len(rows)}...")
-
-                # Create RedditPost object from row data
-                post = RedditPost(
-                    id=row[0],  # reddit_id
-                    title=row[1],  # title
-                    url=row[2],  # url
-                    content=row[3] or "",  # content
-                    subreddit=row[6],  # subreddit_name
-                    created_utc=datetime.strptime(
-                        row[5], "%Y-%m-%d %H:%M:%S"
-                    ).timestamp(),  # added_date
-                    num_comments=row[4],  # num_comments
-                )
-
-                # Generate new summary
-                new_summary = self.ai_service.summarize_post(post)
+        # Create RedditPost objects from row data
+        posts = [
+            RedditPost(
+                id=row[0],  # reddit_id
+                title=row[1],  # title
+                url=row[2],  # url
+                content=row[3] or "",  # content
+                subreddit=row[6],  # subreddit_name
+                created_utc=row[5],  # added_date as a Unix timestamp
+                num_comments=row[4],  # num_comments
+            )
+            for row in rows
+        ]
+        old_summaries = {row[0]: row[7] for row in rows}
 
-                # Update database with new summary
-                cursor.execute(
-                    "UPDATE saved_posts SET summary = ? WHERE reddit_id = ?",
-                    (new_summary, post.id),
-                )
-                self.db.commit()
+        generated, error = self._summarize_posts(
+            posts, progress, "Regenerating summary"
+        )
 
-            # Ensure progress dialog is closed
-            progress.setValue(len(rows))
+        # Update database with the summaries that changed, in one transaction
+        self._store_summaries(
+            [
+                (summary, post_id)
+                for summary, post_id in generated
+                if summary != old_summaries[post_id]
+            ]
+        )
 
-        except Exception as e:
+        if error is not None:
             progress.cancel()
             QMessageBox.warning(
                 self,
                 "Regeneration Error",
-                f"An error occurred while regenerating summaries: {str(e)}",
+                f"An error occurred while regenerating summaries: {str(error)}",
+            )
+        else:
+            # Ensure progress dialog is closed
+            progress.setValue(len(rows))
+
+    def _summarize_posts(
+        self, posts: List[RedditPost], progress: QProgressDialog, label: str
+    ) -> Tuple[List[Tuple[Optional[str], str]], Optional[Exception]]:
+        """
+        Summarize several posts in parallel, showing progress.
+
+        Args:
+            posts: Posts to summarize
+            progress: Progress dialog to update; cancelling it stops the posts
+                that haven't started yet
+            label: Progress label, e.g. "Generating summary"
+
+        Returns:
+            Tuple of (summaries, error): (summary, reddit_id) pairs of the
+            posts summarized before finishing, a cancel or an error, and the
+            error if one occurred
+        """
+        executor = ThreadPoolExecutor(max_workers=MAX_SUMMARY_WORKERS)
+        futures = {
+            executor.submit(self.ai_service.summarize_post, post): post.id
+            for post in posts
+        }
+        try:
+            summaries, error = self._collect_with_progress(futures, progress, label)
+        finally:
+            # Drop posts that haven't started; running ones finish in the
+            # background
+            executor.shutdown(wait=False, cancel_futures=True)
+        return summaries, error
+
+    def _store_summaries(self, summaries: List[Tuple[str, str]]):
+        """
+        Store generated post summaries in a single transaction.
+
+        Args:
+            summaries: Tuples of (summary, reddit_id)
+        """
+        if not summaries:
+            return
+        with self.db.batch():
+            self.db.get_cursor().executemany(
+                "UPDATE saved_posts SET summary = ? WHERE reddit_id = ?", summaries
             )
 
     def _load_search_view(self):
         """Load and display the search view."""
         # Hide other views
-        self.browser.hide()
-        self.nav_buttons.hide()
-        self.subreddit_view.hide()
-        self.summarize_view.hide()
-        self.search_view.show()
+        self._show_views(self.search_view)
+        self._cancel_view_load()
         self._current_view = "search"  # Set current view to search
 
         # Reset window title
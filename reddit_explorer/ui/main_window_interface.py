@@ -3,7 +3,7 @@ Interface for the main window to avoid circular dependencies.
 """
 
 from typing import List, Protocol, TYPE_CHECKING, Optional
-from PySide6.QtWidgets import QWidget, QPushButton, QCheckBox
+from PySide6.QtWidgets import QWidget, QPushButton, QCheckBox, QMenu
 from reddit_explorer.data.models import RedditPost
 from reddit_explorer.data.database import Database
 from reddit_explorer.services.image_service import ImageService
@@ -48,6 +48,22 @@ class MainWindowInterface(Protocol):
         """Update whether a post should be shown in categories view."""
         ...
 
+    def set_post_category(self, post_id: str, category_name: str) -> None:
+        """Move a saved post to another category."""
+        ...
+
+    def get_categories(self) -> List[str]:
+        """Get the names of all categories, in display order."""
+        ...
+
+    def category_post_position(self, post_id: str) -> Optional[int]:
+        """Get the position of a post in current_category_posts."""
+        ...
+
+    def get_category_menu(self) -> QMenu:
+        """Get the menu of categories to move a post to."""
+        ...
+
     def refresh_category_counts(self) -> None:
         """Refresh the category counts in the tree widget."""
         ...
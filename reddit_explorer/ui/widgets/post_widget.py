@@ -2,7 +2,7 @@
 Widget for displaying a single post.
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 from PySide6.QtWidgets import (
     QFrame,
     QVBoxLayout,
@@ -13,10 +13,30 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 from PySide6.QtCore import Qt, QEvent, QPoint
-from PySide6.QtGui import QPixmap, QCursor
+from PySide6.QtGui import QColor, QImage, QPalette, QPixmap, QPixmapCache, QCursor
 from reddit_explorer.data.models import RedditPost
 from reddit_explorer.config.constants import IMAGE_MAX_WIDTH
 from reddit_explorer.ui.main_window_interface import MainWindowInterface
+from reddit_explorer.ui.worker import Worker, start_worker
+
+
+def _load_scaled_image(image_path: str) -> Tuple[str, QImage]:
+    """
+    Decode an image and scale it to IMAGE_MAX_WIDTH.
+
+    Uses QImage rather than QPixmap so it can run on a worker thread.
+
+    Args:
+        image_path: Path of the cached image file
+
+    Returns:
+        Tuple of (image_path, scaled image)
+    """
+    # Scale image to fit width while maintaining aspect ratio
+    image = QImage(image_path).scaledToWidth(
+        IMAGE_MAX_WIDTH, Qt.TransformationMode.SmoothTransformation
+    )
+    return image_path, image
 
 
 class PostWidget(QFrame):
@@ -51,6 +71,12 @@ class PostWidget(QFrame):
         # Make the widget clickable
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
+        # Hover background, painted only while the mouse is over the post;
+        # toggling the fill avoids re-parsing a style sheet on every hover
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("#f0f0f0"))
+        self.setPalette(palette)
+
         # Set context menu policy
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
@@ -85,7 +111,11 @@ class PostWidget(QFrame):
 
         self.title = QLabel(self.post_data.title)
         self.title.setWordWrap(True)
-        self.title.setStyleSheet("font-weight: bold;")
+        # Fonts and palettes are used instead of style sheets, which are parsed
+        # and give each widget its own style object
+        title_font = self.title.font()
+        title_font.setBold(True)
+        self.title.setFont(title_font)
 
         header_layout.addWidget(checkbox_container)
         header_layout.addWidget(self.title, 1)
@@ -94,7 +124,9 @@ class PostWidget(QFrame):
         # Creation time
         time_str = self.post_data.created_time.strftime("%Y-%m-%d %H:%M:%S")
         self.time_label = QLabel(f"Posted: {time_str}")
-        self.time_label.setStyleSheet("color: gray;")
+        time_palette = self.time_label.palette()
+        time_palette.setColor(QPalette.ColorRole.WindowText, QColor("gray"))
+        self.time_label.setPalette(time_palette)
         layout.addWidget(self.time_label)
 
         # Description
@@ -114,14 +146,17 @@ class PostWidget(QFrame):
                 self.post_data.id, self.post_data.url
             )
             if image_path:
-                image_label = QLabel()
-                pixmap = QPixmap(image_path)
-                # Scale image to fit width while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaledToWidth(
-                    IMAGE_MAX_WIDTH, Qt.TransformationMode.SmoothTransformation
-                )
-                image_label.setPixmap(scaled_pixmap)
-                layout.addWidget(image_label)
+                self.image_label = QLabel()
+                layout.addWidget(self.image_label)
+                pixmap = QPixmapCache.find(image_path)
+                if pixmap is not None:
+                    self.image_label.setPixmap(pixmap)
+                else:
+                    # Decode and scale in the background; the label stays
+                    # empty until the image is ready
+                    worker = Worker(_load_scaled_image, image_path)
+                    worker.signals.result_ready.connect(self._set_image)
+                    start_worker(worker)
 
         # Footer (comments count)
         footer_layout = QHBoxLayout()
@@ -134,6 +169,13 @@ class PostWidget(QFrame):
         self.is_saved = False  # Will be set by parent widget
         self.show_in_categories = True  # Will be set by parent widget
 
+    def _set_image(self, result: Tuple[str, QImage]):
+        """Show an image decoded in the background and cache its pixmap."""
+        image_path, image = result
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(image_path, pixmap)
+        self.image_label.setPixmap(pixmap)
+
     def setup_checkbox_connections(self):
         """Connect checkbox signals after initial states are set."""
         self.added_checkbox.stateChanged.connect(self.on_added_checkbox_changed)
@@ -159,14 +201,13 @@ class PostWidget(QFrame):
         """Handle double-click events to open post in browser."""
         # Get the post index if we're in a category
         if self.view_type == "category":
-            for i, post in enumerate(self.main_window.current_category_posts):
-                if post.id == self.post_data.id:
-                    self.main_window.current_post_index = i
-                    # Enable/disable Next button based on position
-                    self.main_window.next_btn.setEnabled(
-                        i < len(self.main_window.current_category_posts) - 1
-                    )
-                    break
+            i = self.main_window.category_post_position(self.post_data.id)
+            if i is not None:
+                self.main_window.current_post_index = i
+                # Enable/disable Next button based on position
+                self.main_window.next_btn.setEnabled(
+                    i < len(self.main_window.current_category_posts) - 1
+                )
 
         # Construct Reddit post URL
         post_url = f"https://www.reddit.com/r/{self.post_data.subreddit}/comments/{self.post_data.id}"
@@ -193,11 +234,11 @@ class PostWidget(QFrame):
 
     def enterEvent(self, event: QEvent):
         """Handle mouse enter events."""
-        self.setStyleSheet("background-color: #f0f0f0;")
+        self.setAutoFillBackground(True)
 
     def leaveEvent(self, event: QEvent):
         """Handle mouse leave events."""
-        self.setStyleSheet("")
+        self.setAutoFillBackground(False)
 
     def _show_context_menu(self, position: QPoint):
         """Show context menu for post widget."""
@@ -213,29 +254,13 @@ class PostWidget(QFrame):
 
     def _show_category_menu(self):
         """Show submenu to select category."""
-        # Get list of categories from database
-        cursor = self.main_window.db.get_cursor()
-        cursor.execute("SELECT name FROM categories ORDER BY name")
-        categories = [row[0] for row in cursor.fetchall()]
-
-        # Create menu
-        menu = QMenu()
-        for category in categories:
-            action = menu.addAction(category)
-            action.setData(category)
-
         # Show menu at cursor position
-        action = menu.exec_(self.cursor().pos())
+        action = self.main_window.get_category_menu().exec_(self.cursor().pos())
         if action:
             new_category = action.data()
-            cursor.execute(
-                "UPDATE saved_posts SET category = ? WHERE reddit_id = ?",
-                (new_category, self.post_data.id),
-            )
-            self.main_window.db.commit()
+            self.main_window.set_post_category(self.post_data.id, new_category)
 
             # Refresh the view - using public methods
-            self.main_window.refresh_category_counts()
             if (
                 hasattr(self.main_window, "current_category")
                 and self.main_window.current_category
@@ -2,7 +2,9 @@
 Widget for displaying search results.
 """
 
-from typing import Optional, Callable, Any, Dict, cast
+import re
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional, Callable, Tuple
 from PySide6.QtWidgets import (
     QScrollArea,
     QWidget,
@@ -13,12 +15,71 @@ from PySide6.QtWidgets import (
     QLabel,
     QCheckBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from reddit_explorer.data.models import RedditPost
 from reddit_explorer.ui.main_window_interface import MainWindowInterface
 from reddit_explorer.ui.widgets.post_widget import PostWidget
-import sqlite3
-from datetime import datetime
+from reddit_explorer.ui.widgets.subreddit_view import POST_BATCH_SIZE
+
+# Search in title, content, and summary with LIMIT; SQLite converts the
+# local-time added_date into a Unix timestamp. {match} filters on the search
+# term, bound as :query, and {visibility} optionally on show_in_categories.
+#
+# Only the first 501 characters of the content are returned, enough for the
+# post widget's 500-character preview. When the raw term, bound as :term, is
+# in neither the title nor that preview but further into the content, the
+# text around its first occurrence there (100 characters either side) is
+# returned as the match context. Both are cut from the 400 results only.
+# py_lower() folds case like Python, including non-ASCII letters.
+_SEARCH_SQL = """
+    SELECT reddit_id, title, url, num_comments, added_timestamp,
+           substr(content, 1, 501),
+           CASE WHEN instr(py_lower(coalesce(title, '')), py_lower(:term)) = 0
+                 AND instr(py_lower(substr(content, 1, 500)), py_lower(:term)) = 0
+                 AND instr(py_lower(substr(content, 501)), py_lower(:term)) > 0
+                THEN substr(
+                    content,
+                    400 + instr(py_lower(substr(content, 501)), py_lower(:term)),
+                    200 + length(:term)
+                )
+           END,
+           show_in_categories, subreddit_name
+    FROM (
+        SELECT sp.reddit_id, sp.title, sp.url, sp.num_comments, sp.added_date,
+               CAST(strftime('%s', sp.added_date, 'utc') AS INTEGER) AS added_timestamp,
+               sp.content, sp.show_in_categories, s.name as subreddit_name
+        FROM saved_posts sp
+        JOIN subreddits s ON sp.subreddit_id = s.id
+        WHERE {match}{visibility}
+        ORDER BY sp.added_date DESC
+        LIMIT 400
+    )
+    ORDER BY added_date DESC
+"""
+
+# Match through the full-text index, with the term quoted as a phrase
+_FTS_MATCH = """sp.id IN (
+        SELECT rowid FROM saved_posts_fts WHERE saved_posts_fts MATCH :query
+    )"""
+
+# Match by scanning with LIKE, with the term wrapped in wildcards
+_LIKE_MATCH = """(sp.title LIKE :query
+        OR sp.content LIKE :query
+        OR sp.summary LIKE :query)"""
+
+# Number of recent searches whose results are kept by SearchView
+_RESULT_CACHE_SIZE = 16
+
+# Search statements keyed by (full_text, saved_only); reusing the same text
+# lets sqlite3 take the prepared statement from its cache
+_SEARCH_STATEMENTS = {
+    (full_text, saved_only): _SEARCH_SQL.format(
+        match=_FTS_MATCH if full_text else _LIKE_MATCH,
+        visibility=" AND sp.show_in_categories = 1" if saved_only else "",
+    )
+    for full_text in (True, False)
+    for saved_only in (True, False)
+}
 
 
 class SearchView(QScrollArea):
@@ -52,6 +113,22 @@ class SearchView(QScrollArea):
         self.results_layout = QVBoxLayout(self.results_container)
         self._layout.addWidget(self.results_container)
 
+        # Results that don't have a widget yet, as (post, show_in_categories)
+        self._pending_results: Deque[Tuple[RedditPost, bool]] = deque()
+        self._batch_scheduled = False
+
+        # Results of recent searches keyed by (search_term, saved_only), most
+        # recent last; valid while the database's data_version is unchanged
+        self._result_cache: (
+            "OrderedDict[Tuple[str, bool], List[Tuple[RedditPost, bool]]]"
+        ) = OrderedDict()
+        self._result_cache_version: Optional[Tuple[int, int]] = None
+
+        # Create queued result widgets as the user scrolls towards them
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_pending_batch)
+        scroll_bar.rangeChanged.connect(self._schedule_pending_batch)
+
     def set_title_callback(self, callback: Callable[[str], None]):
         """Set the callback for updating the window title."""
         self.update_title_callback = callback
@@ -85,35 +162,23 @@ class SearchView(QScrollArea):
         # Add search controls to main layout
         self._layout.addWidget(search_container)
 
-    def _highlight_search_term(self, text: str, search_term: str) -> str:
+    def _highlight_search_term(self, text: str, pattern: "re.Pattern[str]") -> str:
         """
         Highlight search term in text with HTML bold tags, case-insensitive.
 
         Args:
             text: The text to process
-            search_term: The term to highlight
+            pattern: Case-insensitive pattern capturing the search term
 
         Returns:
             Text with search term wrapped in bold tags
         """
-        idx = 0
-        result = ""
-        text_lower = text.lower()
-        term_lower = search_term.lower()
-
-        while idx < len(text):
-            match_idx = text_lower.find(term_lower, idx)
-            if match_idx == -1:
-                result += text[idx:]
-                break
-
-            # Add text before match
-            result += text[idx:match_idx]
-            # Add bold-wrapped match (using original case)
-            result += f"**{text[match_idx:match_idx + len(search_term)]}**"
-            idx = match_idx + len(search_term)
-
-        return result
+        # Splitting on a capturing pattern puts the matches, in their original
+        # case, at the odd positions; wrapping them there is cheaper than
+        # expanding a sub() template per match
+        parts = pattern.split(text)
+        parts[1::2] = [f"**{match}**" for match in parts[1::2]]
+        return "".join(parts)
 
     def _handle_search(self):
         """Handle search button click or enter key press."""
@@ -124,104 +189,115 @@ class SearchView(QScrollArea):
         # Clear previous results
         self.clear_results()
 
-        # Get database cursor
-        cursor = self.main_window.db.get_cursor()
+        # Repeated searches reuse their results until the data changes
+        version = self.main_window.db.data_version()
+        if version != self._result_cache_version:
+            self._result_cache.clear()
+            self._result_cache_version = version
+        key = (search_term, self.saved_only_checkbox.isChecked())
+        results = self._result_cache.get(key)
+        if results is None:
+            results = self._query_results(*key)
+            self._result_cache[key] = results
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        else:
+            self._result_cache.move_to_end(key)
 
-        # Enable dictionary access to rows
-        def dict_factory(
-            cursor: sqlite3.Cursor, row: tuple[Any, ...]
-        ) -> Dict[str, Any]:
-            d = {}
-            for idx, col in enumerate(cursor.description):
-                d[col[0]] = row[idx]
-            return d
-
-        # Cast to avoid type error
-        cursor.row_factory = cast(
-            Callable[[sqlite3.Cursor, sqlite3.Row], Any], dict_factory
-        )
+        self.add_posts(results)
 
-        # Search in title, content, and summary with LIMIT
-        base_query = """
-            SELECT sp.*, s.name as subreddit_name
-            FROM saved_posts sp
-            JOIN subreddits s ON sp.subreddit_id = s.id
-            WHERE (sp.title LIKE ? 
-               OR sp.content LIKE ?
-               OR sp.summary LIKE ?)
+        # Update results count
+        total_posts = len(results)
+        if total_posts == 0:
+            self.show_no_results()
+        else:
+            if self.update_title_callback:
+                self.update_title_callback(
+                    f"Reddit Explorer - Search Results ({total_posts} posts)"
+                )
+
+    def _query_results(
+        self, search_term: str, saved_only: bool
+    ) -> List[Tuple[RedditPost, bool]]:
         """
+        Search the saved posts.
 
-        if self.saved_only_checkbox.isChecked():
-            base_query += " AND sp.show_in_categories = 1"
+        Args:
+            search_term: Term to search titles, contents and summaries for
+            saved_only: Whether to only include posts shown in categories
 
-        base_query += """
-            ORDER BY sp.added_date DESC
-            LIMIT 400
+        Returns:
+            Tuples of (post, show_in_categories), newest first
         """
+        # Get database cursor
+        cursor = self.main_window.db.get_cursor()
+
+        # The trigram full-text index only matches terms of three or more
+        # characters; shorter ones fall back to scanning with LIKE
+        full_text = self.main_window.db.full_text_search and len(search_term) >= 3
+        if full_text:
+            query = '"%s"' % search_term.replace('"', '""')
+        else:
+            query = f"%{search_term}%"
 
         cursor.execute(
-            base_query,
-            (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"),
+            _SEARCH_STATEMENTS[full_text, saved_only],
+            {"query": query, "term": search_term},
         )
 
-        # Process results
-        total_posts = 0
-        for row in cursor.fetchall():
-            # Get content and check for match context
-            content = row["content"] or ""
-            title = row["title"] or ""
-            context = ""
-
-            # Only show context if match is not in title and not in first 500 chars
-            if (
-                search_term.lower() not in title.lower()
-                and search_term.lower() not in content[:500].lower()
-                and search_term.lower() in content[500:].lower()
-            ):
-                # Find the position of the match
-                match_pos = content.lower().find(search_term.lower(), 500)
-                # Get context (100 chars before and after)
-                start = max(0, match_pos - 100)
-                end = min(len(content), match_pos + len(search_term) + 100)
-                context = content[start:end].strip()
-                # Highlight search term and add ellipsis
-                context = self._highlight_search_term(context, search_term)
-                context = f"[...] {context} [...]\n"
+        # Compiled once per search for highlighting match contexts
+        highlight_pattern = re.compile(f"({re.escape(search_term)})", re.IGNORECASE)
+
+        # Process results as SQLite steps through them
+        results: List[Tuple[RedditPost, bool]] = []
+        for row in cursor:
+            # Unpack the row tuple into named variables for clarity
+            (
+                reddit_id,
+                title,
+                url,
+                num_comments,
+                added_timestamp,
+                content,
+                context,
+                show_in_categories,
+                subreddit_name,
+            ) = row
+
+            selftext = content or ""
+            if context:
+                # Prepend the highlighted match context with ellipses
+                context = self._highlight_search_term(
+                    context.strip(), highlight_pattern
+                )
+                selftext = f"[...] {context} [...]\n{selftext}"
 
             # Create post data from database row
             post = RedditPost(
-                id=row["reddit_id"],
-                title=row["title"],
-                url=row["url"],
-                subreddit=row["subreddit_name"],
-                created_utc=datetime.strptime(
-                    row["added_date"], "%Y-%m-%d %H:%M:%S"
-                ).timestamp(),
-                num_comments=row["num_comments"],
-                selftext=(context + content) if context else content,
+                id=reddit_id,
+                title=title or "",
+                url=url,
+                subreddit=subreddit_name,
+                created_utc=added_timestamp,
+                num_comments=num_comments,
+                selftext=selftext,
             )
 
-            # Add post to view
-            self.add_post(
-                post, is_saved=True, show_in_categories=row["show_in_categories"]
-            )
-            total_posts += 1
+            results.append((post, show_in_categories))
 
-        # Update results count
-        if total_posts == 0:
-            self.show_no_results()
-        else:
-            if self.update_title_callback:
-                self.update_title_callback(
-                    f"Reddit Explorer - Search Results ({total_posts} posts)"
-                )
+        return results
 
     def clear_results(self):
         """Clear all search results."""
-        while self.results_layout.count():
-            child = self.results_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._pending_results.clear()
+
+        # Replace the results container rather than removing each result
+        old_container = self.results_container
+        self.results_container = QWidget()
+        self.results_layout = QVBoxLayout(self.results_container)
+        self._layout.replaceWidget(old_container, self.results_container)
+        old_container.hide()
+        old_container.deleteLater()
 
     def show_no_results(self):
         """Show no results message."""
@@ -254,3 +330,40 @@ class SearchView(QScrollArea):
         post_widget.category_checkbox.setChecked(show_in_categories)
         post_widget.setup_checkbox_connections()
         self.results_layout.addWidget(post_widget)
+
+    def add_posts(self, posts: List[Tuple[RedditPost, bool]]):
+        """
+        Add saved post widgets to the results lazily.
+
+        Widgets are created in batches until they fill the visible area plus
+        one page; the rest are created as the user scrolls down.
+
+        Args:
+            posts: Tuples of (post, show_in_categories), in display order
+        """
+        self._pending_results.extend(posts)
+        self._add_pending_batch()
+
+    def _add_pending_batch(self):
+        """Create widgets for the next batch of queued results."""
+        self._batch_scheduled = False
+        self.setUpdatesEnabled(False)
+        try:
+            for _ in range(min(POST_BATCH_SIZE, len(self._pending_results))):
+                post, show_in_categories = self._pending_results.popleft()
+                self.add_post(
+                    post, is_saved=True, show_in_categories=show_in_categories
+                )
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._schedule_pending_batch()
+
+    def _schedule_pending_batch(self, *args):
+        """Schedule another batch if queued results are within a page of view."""
+        if not self._pending_results or self._batch_scheduled:
+            return
+        scroll_bar = self.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() < self.viewport().height():
+            self._batch_scheduled = True
+            QTimer.singleShot(0, self._add_pending_batch)
@@ -2,7 +2,9 @@
 Widget for displaying subreddit posts.
 """
 
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QScrollArea,
     QWidget,
@@ -13,6 +15,9 @@ from reddit_explorer.data.models import RedditPost
 from reddit_explorer.ui.main_window_interface import MainWindowInterface
 from reddit_explorer.ui.widgets.post_widget import PostWidget
 
+# Number of post widgets created at a time by add_posts
+POST_BATCH_SIZE = 25
+
 
 class SubredditView(QScrollArea):
     """Widget to display subreddit posts."""
@@ -36,12 +41,27 @@ class SubredditView(QScrollArea):
         self.setWidget(self.container)
         self.setWidgetResizable(True)
 
+        # Posts that don't have a widget yet, as
+        # (post, is_saved, show_in_categories, view_type)
+        self._pending_posts: Deque[Tuple[RedditPost, bool, bool, str]] = deque()
+        self._batch_scheduled = False
+
+        # Create queued post widgets as the user scrolls towards them
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_pending_batch)
+        scroll_bar.rangeChanged.connect(self._schedule_pending_batch)
+
     def clear(self):
         """Clear all posts."""
-        while self._layout.count():
-            child = self._layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._pending_posts.clear()
+        self.setUpdatesEnabled(False)
+        try:
+            while self._layout.count():
+                child = self._layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def add_description(self, description: str):
         """
@@ -82,6 +102,24 @@ class SubredditView(QScrollArea):
             show_in_categories: Whether to show in categories view
             view_type: Type of view ("subreddit" or "category")
         """
+        if self._pending_posts:
+            # Keep the display order behind posts still waiting for a widget
+            self._pending_posts.append((post, is_saved, show_in_categories, view_type))
+            return
+
+        self._add_post_widget(post, is_saved, show_in_categories, view_type)
+
+        # Scroll to bottom after adding the post
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def _add_post_widget(
+        self,
+        post: RedditPost,
+        is_saved: bool,
+        show_in_categories: bool,
+        view_type: str,
+    ):
+        """Create a post widget and append it to the layout."""
         post_widget = PostWidget(post, self.main_window, view_type)
         post_widget.is_saved = is_saved
         post_widget.show_in_categories = show_in_categories
@@ -93,8 +131,46 @@ class SubredditView(QScrollArea):
         post_widget.setup_checkbox_connections()  # Connect signals after setting states
         self._layout.addWidget(post_widget)
 
-        # Scroll to bottom after adding the post
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+    def add_posts(
+        self, posts: List[Tuple[RedditPost, bool]], view_type: str = "subreddit"
+    ):
+        """
+        Add post widgets lazily.
+
+        Widgets are created in batches, the first one right away, until they
+        fill the visible area plus one page. The rest are created as the user
+        scrolls down, so only posts near the visible area cost a widget (and
+        their image download).
+
+        Args:
+            posts: Tuples of (post, is_saved), in display order
+            view_type: Type of view ("subreddit" or "category")
+        """
+        self._pending_posts.extend(
+            (post, is_saved, True, view_type) for post, is_saved in posts
+        )
+        self._add_pending_batch()
+
+    def _add_pending_batch(self):
+        """Create widgets for the next batch of queued posts."""
+        self._batch_scheduled = False
+        self.setUpdatesEnabled(False)
+        try:
+            for _ in range(min(POST_BATCH_SIZE, len(self._pending_posts))):
+                self._add_post_widget(*self._pending_posts.popleft())
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._schedule_pending_batch()
+
+    def _schedule_pending_batch(self, *args):
+        """Schedule another batch if queued posts are within a page of view."""
+        if not self._pending_posts or self._batch_scheduled:
+            return
+        scroll_bar = self.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() < self.viewport().height():
+            self._batch_scheduled = True
+            QTimer.singleShot(0, self._add_pending_batch)
 
     def scroll_to_bottom(self):
         """Scroll to the bottom of the view."""
@@ -112,4 +188,10 @@ class SubredditView(QScrollArea):
             if isinstance(widget, PostWidget) and widget.post_data.id == post_id:
                 widget.deleteLater()
                 self._layout.removeWidget(widget)
+                return
+
+        # The post may still be waiting for its widget
+        for entry in self._pending_posts:
+            if entry[0].id == post_id:
+                self._pending_posts.remove(entry)
                 break
@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QEvent, QObject
 from reddit_explorer.ui.main_window_interface import MainWindowInterface
 
 
@@ -62,10 +62,13 @@ class SummarizeView(QScrollArea):
 
     def clear(self):
         """Clear all content."""
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Start over with a fresh content widget
+        old_widget = self.content_widget
+        self.content_widget = QWidget()
+        self.content_layout = QVBoxLayout(self.content_widget)
+        self._layout.replaceWidget(old_widget, self.content_widget)
+        old_widget.hide()
+        old_widget.deleteLater()
 
     def display_summaries(self, time_period: str, summaries: List[Tuple[str, str]]):
         """
@@ -104,18 +107,27 @@ class SummarizeView(QScrollArea):
             bullet_widget.setTextFormat(Qt.TextFormat.RichText)
             bullet_widget.setOpenExternalLinks(True)
 
-            # Make the bullet point clickable if it has a post_id
+            # Make the bullet point clickable if it has a post_id; clicks
+            # are handled by eventFilter
             if post_id:
                 bullet_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-                bullet_widget.mousePressEvent = (
-                    lambda ev, pid=post_id: self.main_window.open_post(pid)
-                )
+                bullet_widget.setProperty("post_id", post_id)
+                bullet_widget.installEventFilter(self)
 
             self.content_layout.addWidget(bullet_widget)
 
         # Add stretch at the end
         self.content_layout.addStretch()
 
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Open the post of a clicked bullet point."""
+        if event.type() == QEvent.Type.MouseButtonPress:
+            post_id = watched.property("post_id")
+            if post_id:
+                self.main_window.open_post(post_id)
+                return True
+        return super().eventFilter(watched, event)
+
     def get_cached_summaries(self, time_period: str) -> Optional[List[Tuple[str, str]]]:
         """
         Get cached summaries for a time period.
@@ -0,0 +1,61 @@
+"""
+Background workers for running blocking work off the GUI thread.
+"""
+
+from typing import Any, Callable, Set
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker, delivered on the GUI thread."""
+
+    result_ready = Signal(object)
+    error = Signal(str)
+    finished = Signal()
+
+
+class Worker(QRunnable):
+    """Runnable that executes a callable on a QThreadPool thread."""
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        """
+        Initialize the worker.
+
+        Args:
+            fn: Callable to run on the worker thread
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Run the callable and emit its result or error."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result_ready.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+# Workers are kept referenced until they finish so their queued signals are
+# still delivered after the thread pool releases the runnable
+_active_workers: Set[Worker] = set()
+
+
+def start_worker(worker: Worker) -> None:
+    """
+    Start a worker on the global thread pool.
+
+    Args:
+        worker: The worker to start
+    """
+    _active_workers.add(worker)
+    worker.signals.finished.connect(lambda: _active_workers.discard(worker))
+    QThreadPool.globalInstance().start(worker)